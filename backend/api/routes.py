@@ -3,7 +3,10 @@ API routes for SudokuSensei backend application.
 Provides endpoints for solving Sudoku puzzles and health checks.
 """
 
+import json
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional, Tuple
 
@@ -16,6 +19,7 @@ from services.validation_service import (
     is_solvable,
     has_unique_solution,
 )
+from helpers.read_puzzle import parse_compact_puzzle
 
 # Initialize router
 router = APIRouter()
@@ -23,6 +27,11 @@ router = APIRouter()
 # Initialize services
 solver = SudokuSolver()  # Keep for backward compatibility if needed
 
+# Shared compact encoder for streamed lines; json.dumps with options would
+# build a new encoder per call. Steps hold tuples, so `default` only catches
+# stray sets.
+_LINE_ENCODER = json.JSONEncoder(default=sorted, separators=(",", ":"))
+
 
 # Data models
 class PuzzleInput(BaseModel):
@@ -34,6 +43,15 @@ class PuzzleInput(BaseModel):
     )
 
 
+class CompactPuzzleInput(BaseModel):
+    """Input model for a Sudoku puzzle written as one 81-character string"""
+
+    puzzle: str = Field(
+        ...,
+        description="81 characters, row by row: 1-9 for filled cells, 0 or '.' for empty cells",
+    )
+
+
 class CandidateChange(BaseModel):
     """Model for a change in candidates for a cell"""
 
@@ -118,45 +136,21 @@ def format_error(error_type: str, message: str, suggestions: List[str]) -> dict:
     ).dict()
 
 
-# API endpoints
-@router.get("/")
-def health_check():
-    """Basic health check endpoint"""
-    return {"status": "SudokuSensei backend is running!", "version": "1.0"}
-
-
-@router.get("/health")
-def detailed_health():
-    """Detailed health check with service information"""
-    return {
-        "status": "healthy",
-        "service": "SudokuSensei API",
-        "endpoints": ["/", "/health", "/solve"],
-        "cors_enabled": True,
-        "frontend_url": "http://localhost:3000",
-    }
-
-
-@router.post("/solve", response_model=SolveResponse)
-def solve_sudoku(data: PuzzleInput):
+def _validate_puzzle(puzzle: List[List[int]], require_unique: bool = True) -> None:
     """
-    Solve a Sudoku puzzle using advanced logical techniques.
-
-    This endpoint validates the input puzzle format, checks if it's solvable and has a unique solution,
-    then attempts to solve it using various Sudoku solving techniques.
+    Check a puzzle before solving it, shared by the solve endpoints.
 
     Args:
-        data: Puzzle input containing 9x9 grid where 0 represents empty cells
-
-    Returns:
-        Solved puzzle with metadata including techniques used
+        puzzle: 9x9 grid where 0 represents empty cells
+        require_unique: Also reject puzzles with more than one solution
 
     Raises:
         HTTPException(400): If puzzle format is invalid
-        HTTPException(422): If puzzle is unsolvable or has multiple solutions
+        HTTPException(422): If puzzle is unsolvable, or has multiple solutions
+            when require_unique is set
     """
     # Validate puzzle format
-    if not is_valid_format(data.puzzle):
+    if not is_valid_format(puzzle):
         raise HTTPException(
             status_code=400,
             detail=format_error(
@@ -171,7 +165,7 @@ def solve_sudoku(data: PuzzleInput):
         )
 
     # Check if puzzle is solvable
-    if not is_solvable(data.puzzle):
+    if not is_solvable(puzzle):
         raise HTTPException(
             status_code=422,
             detail=format_error(
@@ -186,7 +180,7 @@ def solve_sudoku(data: PuzzleInput):
         )
 
     # Check if puzzle has a unique solution
-    if not has_unique_solution(data.puzzle):
+    if require_unique and not has_unique_solution(puzzle):
         raise HTTPException(
             status_code=422,
             detail=format_error(
@@ -201,6 +195,46 @@ def solve_sudoku(data: PuzzleInput):
             ),
         )
 
+
+# API endpoints
+@router.get("/")
+def health_check():
+    """Basic health check endpoint"""
+    return {"status": "SudokuSensei backend is running!", "version": "1.0"}
+
+
+@router.get("/health")
+def detailed_health():
+    """Detailed health check with service information"""
+    return {
+        "status": "healthy",
+        "service": "SudokuSensei API",
+        "endpoints": ["/", "/health", "/solve", "/solve/compact", "/solve-stream"],
+        "cors_enabled": True,
+        "frontend_url": "http://localhost:3000",
+    }
+
+
+@router.post("/solve", response_model=SolveResponse)
+def solve_sudoku(data: PuzzleInput):
+    """
+    Solve a Sudoku puzzle using advanced logical techniques.
+
+    This endpoint validates the input puzzle format, checks if it's solvable and has a unique solution,
+    then attempts to solve it using various Sudoku solving techniques.
+
+    Args:
+        data: Puzzle input containing 9x9 grid where 0 represents empty cells
+
+    Returns:
+        Solved puzzle with metadata including techniques used
+
+    Raises:
+        HTTPException(400): If puzzle format is invalid
+        HTTPException(422): If puzzle is unsolvable or has multiple solutions
+    """
+    _validate_puzzle(data.puzzle)
+
     # Use the step-by-step solver for single technique application
     result = step_by_step_solver.solve(data.puzzle)
 
@@ -213,6 +247,64 @@ def solve_sudoku(data: PuzzleInput):
     )
 
 
+@router.post("/solve/compact", response_model=SolveResponse)
+def solve_sudoku_compact(data: CompactPuzzleInput):
+    """
+    Solve a Sudoku puzzle given as an 81-character string (e.g. "53..7....").
+
+    The string is parsed into a grid, then solved exactly like /solve.
+
+    Raises:
+        HTTPException(400): If the string is not 81 digits or '.' characters
+        HTTPException(422): If puzzle is unsolvable or has multiple solutions
+    """
+    try:
+        puzzle = parse_compact_puzzle(data.puzzle)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=format_error(
+                "INVALID_FORMAT",
+                "Puzzle must be 81 characters of digits 0-9 or '.'",
+                [
+                    "Write the grid row by row as a single string",
+                    "Use 0 or '.' for empty cells and numbers 1-9 for filled cells",
+                ],
+            ),
+        )
+    return solve_sudoku(PuzzleInput(puzzle=puzzle))
+
+
+@router.post("/solve-stream")
+def solve_sudoku_stream(data: PuzzleInput):
+    """
+    Solve a Sudoku puzzle and stream the solving steps as NDJSON.
+
+    Each line is one solving step, serialized as soon as the solver produces
+    it; the final line holds the result summary (solved grid, status and
+    techniques applied). Validation matches the /solve endpoint.
+
+    Args:
+        data: Puzzle input containing 9x9 grid where 0 represents empty cells
+
+    Returns:
+        Streaming response with one JSON object per line
+
+    Raises:
+        HTTPException(400): If puzzle format is invalid
+        HTTPException(422): If puzzle is unsolvable or has multiple solutions
+    """
+    _validate_puzzle(data.puzzle)
+
+    def generate_lines():
+        summary = {}
+        for step in frontend_solver.iter_steps(data.puzzle, summary):
+            yield _LINE_ENCODER.encode(step) + "\n"
+        yield _LINE_ENCODER.encode(summary) + "\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/solve-step", response_model=SolveResponse)
 def solve_single_step(data: PuzzleInput):
     """
@@ -231,34 +323,8 @@ def solve_single_step(data: PuzzleInput):
         HTTPException(400): If puzzle format is invalid
         HTTPException(422): If puzzle is unsolvable
     """
-    # Validate puzzle format
-    if not is_valid_format(data.puzzle):
-        raise HTTPException(
-            status_code=400,
-            detail=format_error(
-                "INVALID_FORMAT",
-                "Puzzle must be a 9x9 grid with numbers 0-9",
-                [
-                    "Ensure your puzzle is exactly 9 rows and 9 columns",
-                    "Use 0 for empty cells and numbers 1-9 for filled cells",
-                    "Check that all values are integers between 0 and 9",
-                ],
-            ),
-        )
-
-    # Check if puzzle is solvable
-    if not is_solvable(data.puzzle):
-        raise HTTPException(
-            status_code=422,
-            detail=format_error(
-                "NO_SOLUTION",
-                "This puzzle is not solvable - it violates Sudoku rules",
-                [
-                    "Check for duplicate numbers in rows, columns, or 3x3 boxes",
-                    "Verify that the puzzle follows standard Sudoku rules",
-                ],
-            ),
-        )
+    # A single step is still useful on puzzles with several solutions
+    _validate_puzzle(data.puzzle, require_unique=False)
 
     # Apply single step using step-by-step solver
     from board.board import SudokuBoard
@@ -288,7 +354,7 @@ def solve_single_step(data: PuzzleInput):
             constraint_changes = board.update_candidates()
 
             # Build response
-            solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+            solved_grid = board.export_values()
 
             # Create single solving step
             solving_step = {
@@ -297,9 +363,7 @@ def solve_single_step(data: PuzzleInput):
                 "technique": step.technique,
                 "description": step.description,
                 "cells_solved": 1 if step.value else 0,
-                "candidates_eliminated": len(
-                    [pos for elim in step.eliminations for pos in elim.values()]
-                ),
+                "candidates_eliminated": len(step.eliminations),
                 "candidate_changes": [],  # Could be enhanced to show detailed changes
                 "focus_cells": step.focus_cells,
                 "solved_positions": (
@@ -320,7 +384,7 @@ def solve_single_step(data: PuzzleInput):
             )
 
     # No technique could be applied
-    solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+    solved_grid = board.export_values()
     return SolveResponse(
         solved_grid=solved_grid,
         is_solved=board.is_solved(),
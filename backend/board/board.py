@@ -1,123 +1,335 @@
-from .cell import Cell
+import logging
+import threading
+from array import array
+from .cell import ALL_CANDIDATES_MASK, Cell, MASK_DIGITS, mask_to_candidates
 from helpers.get_location import get_cell_location
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-thread board handed out by SudokuBoard.pooled()
+_pool = threading.local()
+
+# Unit ids: rows are 0-8, columns 9-17, boxes 18-26
+ALL_UNITS = frozenset(range(27))
+
+
+def _peer_positions(r, c):
+    """
+    Compute the positions sharing a row, column, or box with (r, c).
+    """
+    peers = set()
+    # same row & column
+    peers.update((r, i) for i in range(9) if i != c)
+    peers.update((i, c) for i in range(9) if i != r)
+    # same 3×3 box
+    br, bc = 3 * (r // 3), 3 * (c // 3)
+    for rr in range(br, br + 3):
+        for cc in range(bc, bc + 3):
+            if (rr, cc) != (r, c):
+                peers.add((rr, cc))
+    return tuple(peers)
+
+
+# PEER_POSITIONS[r][c]: the 20 (row, col) positions sharing a unit with (r, c)
+PEER_POSITIONS = tuple(tuple(_peer_positions(r, c) for c in range(9)) for r in range(9))
+
+
+def get_unit_ids(r, c):
+    """
+    Return the ids of the row, column and box units containing (r, c).
+    """
+    return (r, 9 + c, 18 + 3 * (r // 3) + c // 3)
+
+
+def _build_tables():
+    """
+    Build the unit and peer tables over flat cell indices (9 * row + col).
+    """
+    units = tuple(
+        tuple(i for i in range(81) if unit in get_unit_ids(i // 9, i % 9))
+        for unit in range(27)
+    )
+    peers = tuple(
+        frozenset(j for unit in get_unit_ids(i // 9, i % 9) for j in units[unit]) - {i}
+        for i in range(81)
+    )
+    return units, peers
+
+
+# UNITS[unit_id]: the 9 flat indices in that unit, row-major
+# PEERS[i]: the 20 flat indices sharing a unit with cell i
+UNITS, PEERS = _build_tables()
+
+# CELL_UNIT_IDS[i]: the (row, column, box) unit ids of flat index i
+CELL_UNIT_IDS = tuple(get_unit_ids(*divmod(i, 9)) for i in range(81))
+
+
+# VALUE_BITS[v]: the candidate bit for value v; 1 (bit 0) for an empty cell,
+# which no candidate mask ever contains
+VALUE_BITS = tuple(1 << v for v in range(10))
+
+
+def unit_used_masks(values):
+    """
+    Return the 27 unit masks of values placed in each row, column and box,
+    built in one pass over an 81-byte value snapshot.
+    """
+    unit_used = [0] * 27
+    for value, (row_id, col_id, box_id) in zip(values, CELL_UNIT_IDS):
+        bit = VALUE_BITS[value]
+        unit_used[row_id] |= bit
+        unit_used[col_id] |= bit
+        unit_used[box_id] |= bit
+    return unit_used
+
+
+def format_candidate_change(change):
+    """
+    Expand a (cell_idx, eliminated_mask, old_mask, new_mask) change record
+    into the dict shape used in solving steps. Candidates are sorted tuples,
+    which serialize to JSON without a fallback encoder.
+    """
+    cell_idx, eliminated, old, new = change
+    r, c = divmod(cell_idx, 9)
+    return {
+        "position": (r, c),
+        "location": get_cell_location(r, c),
+        "eliminated": MASK_DIGITS[eliminated],
+        "old_candidates": MASK_DIGITS[old],
+        "new_candidates": MASK_DIGITS[new],
+    }
+
+
+def snapshot_to_grid(values):
+    """
+    Expand an 81-byte value snapshot into a 9x9 list of lists.
+    """
+    return [list(values[i : i + 9]) for i in range(0, 81, 9)]
+
+
+def snapshot_to_candidates(masks, row_cache=None):
+    """
+    Expand an 81-entry candidate mask snapshot into a 9x9 grid of sorted
+    candidate lists. Rows already in `row_cache` (keyed by their mask bytes)
+    are reused instead of rebuilt, so steps of one solve share unchanged rows.
+    """
+    grid = []
+    for i in range(0, 81, 9):
+        row_masks = masks[i : i + 9]
+        if row_cache is None:
+            row = [list(MASK_DIGITS[m]) for m in row_masks]
+        else:
+            key = row_masks.tobytes()
+            row = row_cache.get(key)
+            if row is None:
+                row = row_cache[key] = [list(MASK_DIGITS[m]) for m in row_masks]
+        grid.append(row)
+    return grid
+
+
+def snapshot_fingerprint(values, masks):
+    """
+    Pack a (values, masks) snapshot into one int that identifies the board
+    state exactly: 8 bits per cell value, then 16 bits per candidate mask.
+    """
+    return int.from_bytes(values + masks.tobytes(), "little")
 
 
 class SudokuBoard:
     def __init__(self, grid):  # grid is a 9x9 list of lists of integers
         self.grid = [[Cell(val, is_initial=(val != 0)) for val in row] for row in grid]
+        # The same Cell objects, flat and row-major, for table lookups
+        self.cells = [cell for row in self.grid for cell in row]
+        # UNITS as Cell objects, built once: cells are mutated in place, never
+        # replaced, so these tuples stay valid across steps and reset()
+        self.units = tuple(tuple(self.cells[i] for i in unit) for unit in UNITS)
+        # technique name -> unit ids changed since that technique last ran
+        self.dirty_units = {}
+        # (values, masks) as of the last update_candidates(), None before the first
+        self._synced = None
+
+    def reset(self, grid):
+        """
+        Load a new puzzle into this board, reusing the existing Cell objects.
+        """
+        for row_cells, row_values in zip(self.grid, grid):
+            for cell, val in zip(row_cells, row_values):
+                cell.reset(val, is_initial=(val != 0))
+        self.dirty_units = {}
+        self._synced = None
+
+    @classmethod
+    def pooled(cls, grid):
+        """
+        Return this thread's reusable board, reset to `grid`, to avoid
+        rebuilding 81 cells per solve. The board is shared by every caller on
+        the thread, so it must not be held across another pooled() call.
+        """
+        board = getattr(_pool, "board", None)
+        if board is None:
+            board = _pool.board = cls(grid)
+        else:
+            board.reset(grid)
+        return board
+
+    def mark_dirty(self, positions):
+        """
+        Mark the units containing each (row, col) position dirty for every technique.
+        """
+        if not self.dirty_units:
+            return
+        units = set()
+        for r, c in positions:
+            units.update(get_unit_ids(r, c))
+        for bucket in self.dirty_units.values():
+            bucket.update(units)
+
+    def has_dirty_units(self, technique):
+        """
+        Check whether any unit changed since `technique` last ran.
+        A technique that has never run sees every unit as dirty.
+        """
+        return bool(self.dirty_units.get(technique, ALL_UNITS))
+
+    def clear_dirty_units(self, technique):
+        """
+        Mark `technique` as up to date with the current board state.
+        """
+        self.dirty_units[technique] = set()
 
     def get_row(self, r):
         return self.grid[r]
 
     def get_col(self, c):
-        return [self.grid[r][c] for r in range(9)]
+        return list(self.units[9 + c])
 
     def get_box(self, r, c):
-        start_row, start_col = 3 * (r // 3), 3 * (c // 3)
-        return [
-            self.grid[i][j]
-            for i in range(start_row, start_row + 3)
-            for j in range(start_col, start_col + 3)
-        ]
+        return list(self.units[CELL_UNIT_IDS[9 * r + c][2]])
+
+    def get_box_by_index(self, b):
+        """
+        Return the cells of box `b` (0-8, row-major over the 3x3 boxes), row-major.
+        """
+        return list(self.units[18 + b])
 
     def get_peer_positions(self, r: int, c: int) -> set[tuple[int, int]]:
         """
         Return all (row,col) positions that share a row, column, or box with (r,c), excluding (r,c) itself.
         """
-        peers = set()
-        # same row & column
-        peers.update((r, i) for i in range(9) if i != c)
-        peers.update((i, c) for i in range(9) if i != r)
-        # same 3×3 box
-        br, bc = 3 * (r // 3), 3 * (c // 3)
-        for rr in range(br, br + 3):
-            for cc in range(bc, bc + 3):
-                if (rr, cc) != (r, c):
-                    peers.add((rr, cc))
-        return peers
+        return set(PEER_POSITIONS[r][c])
 
-    def update_candidates_for_cells(self, positions):
+    def update_candidates_for_cells(self, positions, values=None):
         """
         Update candidates for a list of (row, col) positions based on current board state.
-        Returns a list of candidate-change dicts for tracking/explanation.
+        Returns a list of (cell_idx, eliminated_mask, old_mask, new_mask) change
+        records for tracking/explanation; see format_candidate_change.
+
+        `values` is an optional up-to-date value snapshot of the board, saving
+        a walk over the cells when the caller already holds one.
         """
+        if values is None:
+            values = bytes(cell.get_value() for cell in self.cells)
+        unit_used = unit_used_masks(values)
         changes = []
         for r, c in positions:
             cell = self.grid[r][c]
             if cell.is_solved():
                 continue
-            used_values = (
-                {peer.get_value() for peer in self.get_row(r) if peer.is_solved()}
-                | {peer.get_value() for peer in self.get_col(c) if peer.is_solved()}
-                | {peer.get_value() for peer in self.get_box(r, c) if peer.is_solved()}
-            )
-            old = cell.get_candidates()
-            new = old - used_values
-            if new != old:
-                cell.set_candidates(new)
-                eliminated = old - new
-                changes.append(
-                    {
-                        "position": (r, c),
-                        "location": get_cell_location(r, c),
-                        "old_candidates": old,
-                        "new_candidates": new,
-                        "eliminated": eliminated,
-                    }
-                )
-                print(
-                    f"Updated candidates at {get_cell_location(r, c)}: {old} -> {new}"
-                )
+            row_id, col_id, box_id = CELL_UNIT_IDS[9 * r + c]
+            used_mask = unit_used[row_id] | unit_used[col_id] | unit_used[box_id]
+            old_mask = cell.get_mask()
+            new_mask = old_mask & ~used_mask
+            if new_mask != old_mask:
+                cell.set_mask(new_mask)
+                changes.append((9 * r + c, old_mask & ~new_mask, old_mask, new_mask))
+                if settings.SUDOKU_CANDIDATE_TRACE:
+                    logger.debug(
+                        "Updated candidates at %s: %s -> %s",
+                        get_cell_location(r, c),
+                        mask_to_candidates(old_mask),
+                        mask_to_candidates(new_mask),
+                    )
+        self.mark_dirty(divmod(change[0], 9) for change in changes)
         return changes
 
     def update_candidates(self):
         """
         Update candidates for all cells on the board.
-        Returns a list of all candidate changes.
+        Returns a list of all candidate change records.
+
+        After the first full pass, only cells that can have gone stale since
+        the previous call are rescanned: peers of cells whose value changed,
+        and cells that gained candidates (e.g. via set_candidates). Every
+        other cell already excludes its peers' values, since those are
+        unchanged and its candidates only shrank.
         """
-        all_positions = [(r, c) for r in range(9) for c in range(9)]
-        return self.update_candidates_for_cells(all_positions)
+        values, masks = self.snapshot()
+        if self._synced is None:
+            positions = [(r, c) for r in range(9) for c in range(9)]
+        else:
+            synced_values, synced_masks = self._synced
+            stale = set()
+            # Most calls find the board as it was left (a technique that did
+            # not apply), so whole-snapshot compares skip the per-cell scans
+            if values != synced_values:
+                for i in range(81):
+                    if values[i] != synced_values[i]:
+                        stale.update(PEERS[i])
+            if masks != synced_masks:
+                for i in range(81):
+                    if masks[i] & ~synced_masks[i]:
+                        stale.add(i)
+            # Row-major, so change records come out in full-pass order
+            positions = [divmod(i, 9) for i in sorted(stale)]
+        changes = (
+            self.update_candidates_for_cells(positions, values) if positions else []
+        )
+        for cell_idx, _, _, new_mask in changes:
+            masks[cell_idx] = new_mask
+        self._synced = (values, masks)
+        return changes
 
     def update_peers_candidates(self, r, c, value):
         """
         After setting a value at (r, c), remove `value` from candidates
         of all peer cells in the same row, column, and 3×3 box.
-        Returns the list of changes made.
+        Returns the list of change records made.
         """
-        peers = self.get_peer_positions(r, c)
+        peers = PEER_POSITIONS[r][c]
+        bit = 1 << value
         changes = []
         for pr, pc in peers:
             peer = self.grid[pr][pc]
             if not peer.is_solved():
-                old = peer.get_candidates()
-                new = old - {value}
-                if new != old:
-                    peer.set_candidates(new)
-                    eliminated = old - new
-                    changes.append(
-                        {
-                            "position": (pr, pc),
-                            "location": get_cell_location(pr, pc),
-                            "old_candidates": old,
-                            "new_candidates": new,
-                            "eliminated": eliminated,
-                        }
-                    )
-                    print(
-                        f"Updated candidates at {get_cell_location(pr, pc)}: {old} -> {new}"
-                    )
+                old_mask = peer.get_mask()
+                if old_mask & bit:
+                    new_mask = old_mask ^ bit
+                    peer.set_mask(new_mask)
+                    changes.append((9 * pr + pc, bit, old_mask, new_mask))
+                    if settings.SUDOKU_CANDIDATE_TRACE:
+                        logger.debug(
+                            "Updated candidates at %s: %s -> %s",
+                            get_cell_location(pr, pc),
+                            mask_to_candidates(old_mask),
+                            mask_to_candidates(new_mask),
+                        )
+        self.mark_dirty(divmod(change[0], 9) for change in changes)
         return changes
 
     def display_simple(self):
+        lines = []
         for i, row in enumerate(self.grid):
             if i % 3 == 0 and i != 0:
-                print("-" * 21)
-            print(
+                lines.append("-" * 21)
+            lines.append(
                 " ".join(
                     str(cell) if (j + 1) % 3 else f"{cell} |"
                     for j, cell in enumerate(row)
                 )
             )
+        # One write for the whole board rather than one print per row
+        print("\n".join(lines))
 
     def display_with_candidates(self):
         def format_candidates(candidates):
@@ -135,7 +347,8 @@ class SudokuBoard:
         sub_rows = []
 
         for r in range(num_rows):
-            row_lines = ["", "", ""]
+            # Pieces of the row's three text lines, joined once at the end
+            row_parts = ([], [], [])
             for c in range(num_cols):
                 cell = self.grid[r][c]
                 cell_grid = (
@@ -143,50 +356,57 @@ class SudokuBoard:
                     if cell.is_solved()
                     else format_candidates(cell.get_candidates())
                 )
+                separator = " || " if c in [2, 5] else " | "
                 for i in range(3):
-                    row_lines[i] += cell_grid[i]
-                    row_lines[i] += " || " if c in [2, 5] else " | "
-            sub_rows.extend(row_lines)
+                    row_parts[i].append(cell_grid[i])
+                    row_parts[i].append(separator)
+            sub_rows.extend("".join(parts) for parts in row_parts)
             sub_rows.append(
                 "=" * (num_cols * 6 + 1) if r in [2, 5, 8] else "-" * (num_cols * 6 + 1)
             )
 
-        for sub_row in sub_rows:
-            print(sub_row)
+        print("\n".join(sub_rows))
 
     def get_candidates_grid(self):
         """
         Returns a 9x9 grid of candidate sets for each cell.
         """
-        return [[cell.get_candidates().copy() for cell in row] for row in self.grid]
+        return [[cell.get_candidates() for cell in row] for row in self.grid]
+
+    def export_values(self):
+        """
+        Returns a 9x9 grid of cell values (0 for empty).
+        """
+        return [[cell.get_value() for cell in row] for row in self.grid]
+
+    def get_candidates_bitmask(self):
+        """
+        Return an array('H') of the 81 cells' candidate bitmasks, row-major.
+        This is the compact form for snapshots; get_candidates_grid() gives sets.
+        """
+        return array("H", [cell.get_mask() for cell in self.cells])
+
+    def snapshot(self):
+        """
+        Return the board state as (values, masks): an 81-byte string of cell
+        values and an array('H') of 81 candidate bitmasks, both row-major.
+        """
+        values = bytes([cell.get_value() for cell in self.cells])
+        return values, self.get_candidates_bitmask()
 
     def is_solved(self):
         """
         Check if the board is completely solved and valid.
         """
-        for r in range(9):
-            for c in range(9):
-                cell = self.grid[r][c]
-                if not cell.is_solved():
-                    return False
-                val = cell.get_value()
-                # Check row uniqueness
-                row_vals = [self.grid[r][j].get_value() for j in range(9) if j != c]
-                if val in row_vals:
-                    return False
-                # Check column uniqueness
-                col_vals = [self.grid[i][c].get_value() for i in range(9) if i != r]
-                if val in col_vals:
-                    return False
-                # Check box uniqueness
-                start_r = (r // 3) * 3
-                start_c = (c // 3) * 3
-                box_vals = [
-                    self.grid[i][j].get_value()
-                    for i in range(start_r, start_r + 3)
-                    for j in range(start_c, start_c + 3)
-                    if (i, j) != (r, c)
-                ]
-                if val in box_vals:
-                    return False
-        return True
+        values = bytes([cell.get_value() for cell in self.cells])
+        if 0 in values:
+            return False
+        return self._is_valid(values)
+
+    @staticmethod
+    def _is_valid(values):
+        """
+        Check that no row, column, or box of a filled 81-value row-major board
+        repeats a digit: with nine cells each, every unit then uses all nine.
+        """
+        return all(used == ALL_CANDIDATES_MASK for used in unit_used_masks(values))
@@ -1,11 +1,59 @@
 from colorama import Fore, Style
 
 
+def candidates_to_mask(candidates):
+    """
+    Pack a set of candidate digits into a bitmask (bit d set for digit d).
+    """
+    mask = 0
+    for d in candidates:
+        mask |= 1 << d
+    return mask
+
+
+def mask_to_candidates(mask):
+    """
+    Unpack a candidate bitmask into a set of digits.
+    """
+    return {d for d in range(1, 10) if mask >> d & 1}
+
+
+# Bits 1-9 set: every digit is a candidate
+ALL_CANDIDATES_MASK = 0x3FE
+
+# Sorted digits of every 10-bit candidate mask, for unpacking without set building
+MASK_DIGITS = tuple(
+    tuple(d for d in range(1, 10) if mask >> d & 1) for mask in range(1 << 10)
+)
+
+# Number of set bits in every 10-bit mask, for counting without
+# int.bit_count() (Python 3.10+); also fits 9-bit cell position masks
+MASK_POPCOUNT = tuple(bin(mask).count("1") for mask in range(1 << 10))
+
+
+# Colored __repr__ strings, built once: empty, given (white) and solved (blue)
+_EMPTY_REPR = Fore.YELLOW + "." + Style.RESET_ALL
+_INITIAL_REPRS = tuple(Fore.WHITE + str(v) + Style.RESET_ALL for v in range(10))
+_SOLVED_REPRS = tuple(Fore.BLUE + str(v) + Style.RESET_ALL for v in range(10))
+
+
 class Cell:
+    # Fixed attribute layout: no per-cell __dict__ for the 81 cells of a board
+    __slots__ = ("_value", "is_initial", "_mask")
+
     def __init__(self, value=0, is_initial=False):
         self._value = value  # Private backing variable
         self.is_initial = is_initial
-        self._candidates = set(range(1, 10)) if value == 0 else set()
+        # Candidates as a bitmask, bit d set when digit d is possible
+        self._mask = ALL_CANDIDATES_MASK if value == 0 else 0
+
+    def reset(self, value=0, is_initial=False):
+        """
+        Reinitialise the cell in place, as if freshly constructed.
+        """
+        self._value = value
+        self.is_initial = is_initial
+        self._mask = ALL_CANDIDATES_MASK if value == 0 else 0
 
     def is_solved(self):
         return self._value != 0
@@ -20,22 +68,46 @@ class Cell:
             raise ValueError("Value must be an integer between 0 and 9")
         self._value = new_value
         if new_value != 0:
-            self._candidates = set()  # Clear candidates when solved
+            self._mask = 0  # Clear candidates when solved
 
-    # ✅ Getter for candidates
+    # ✅ Getter for candidates (a new set each call; mutate via set_candidates)
     def get_candidates(self):
-        return self._candidates
+        return set(MASK_DIGITS[self._mask])
+
+    # Candidates in ascending order, straight from the mask table (no sort)
+    @property
+    def sorted_candidates(self):
+        return MASK_DIGITS[self._mask]
 
     # ✅ Setter for candidates
     def set_candidates(self, new_candidates):
         if not isinstance(new_candidates, set):
             raise ValueError("Candidates must be a set")
-        self._candidates = new_candidates
+        self._mask = candidates_to_mask(new_candidates)
+
+    # Fast paths for bitmask-aware callers
+    def get_mask(self):
+        return self._mask
+
+    def set_mask(self, mask):
+        self._mask = mask
+
+    def candidate_count(self):
+        """
+        Return how many candidates the cell has, without building a set.
+        """
+        return MASK_POPCOUNT[self._mask]
+
+    def only_candidate(self):
+        """
+        Return the candidate of a cell with exactly one candidate.
+        """
+        return self._mask.bit_length() - 1
 
     def __repr__(self):
         if self._value == 0:
-            return Fore.YELLOW + "." + Style.RESET_ALL
+            return _EMPTY_REPR
         elif self.is_initial:
-            return Fore.WHITE + str(self._value) + Style.RESET_ALL
+            return _INITIAL_REPRS[self._value]
         else:
-            return Fore.BLUE + str(self._value) + Style.RESET_ALL
+            return _SOLVED_REPRS[self._value]
@@ -42,6 +42,9 @@ class Settings:
 
     # Sudoku Solver Configuration
     SUDOKU_MAX_ITERATIONS: int = 100  # Default max iterations for all solvers
+    # Log every candidate change at DEBUG level; off by default, as the
+    # formatting alone outweighs the solving work
+    SUDOKU_CANDIDATE_TRACE: bool = os.getenv("SUDOKU_CANDIDATE_TRACE", "0") == "1"
 
 
 # Global settings instance
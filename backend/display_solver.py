@@ -6,21 +6,23 @@ Provides clean, organized output with proper formatting.
 from services.enhanced_solver import enhanced_solver
 from helpers.get_location import get_cell_location
 
+# Render empty cells (0) as dots
+BLANK_AS_DOT = str.maketrans("0", ".")
+
 
 def print_grid_with_title(grid, title="Grid State"):
     """Print a Sudoku grid with a title and nice formatting."""
-    print(f"\n{title}:")
-    print("┌───────┬───────┬───────┐")
+    lines = [f"\n{title}:", "┌───────┬───────┬───────┐"]
     for i, row in enumerate(grid):
-        print("│", end=" ")
-        for j, cell in enumerate(row):
-            print(cell if cell != 0 else ".", end=" ")
-            if j % 3 == 2 and j < 8:
-                print("│", end=" ")
-        print("│")
+        cells = "".join(map(str, row)).translate(BLANK_AS_DOT)
+        lines.append(
+            f"│ {' '.join(cells[:3])} │ {' '.join(cells[3:6])} │ {' '.join(cells[6:])} │"
+        )
         if i % 3 == 2 and i < 8:
-            print("├───────┼───────┼───────┤")
-    print("└───────┴───────┴───────┘")
+            lines.append("├───────┼───────┼───────┤")
+    lines.append("└───────┴───────┴───────┘")
+    # One write for the whole grid rather than one print per cell
+    print("\n".join(lines))
 
 
 def print_step_header(step_num, technique, cells_solved, candidates_eliminated):
@@ -90,7 +92,7 @@ def solve_and_display(puzzle, show_candidates=False, pause_between_steps=False):
 
     # Show initial puzzle
     print_grid_with_title(puzzle, "Initial Puzzle")
-    empty_count = sum(1 for row in puzzle for cell in row if cell == 0)
+    empty_count = sum(row.count(0) for row in puzzle)
     print(f"\n📊 Initial Analysis: {empty_count} empty cells to solve")
 
     if pause_between_steps:
@@ -127,7 +129,7 @@ def solve_and_display(puzzle, show_candidates=False, pause_between_steps=False):
         print_grid_with_title(step["grid"], f"Grid After Step {i}")
 
         # Show remaining empty cells
-        remaining = sum(1 for row in step["grid"] for cell in row if cell == 0)
+        remaining = sum(row.count(0) for row in step["grid"])
         if remaining > 0:
             print(f"\n📊 Progress: {remaining} cells remaining")
         else:
@@ -157,9 +159,7 @@ def solve_with_basic_display(puzzle):
 
     result = enhanced_solver.solve(puzzle)
 
-    print(
-        f"📊 Initial: {sum(1 for row in puzzle for cell in row if cell == 0)} empty cells"
-    )
+    print(f"📊 Initial: {sum(row.count(0) for row in puzzle)} empty cells")
 
     step_count = 0
     for step in result["solving_steps"]:
@@ -178,7 +178,7 @@ def solve_with_basic_display(puzzle):
             print(f"Step {step_count}: {step['technique']}")
             print(f"  ✅ Filled: {positions_str}")
 
-            remaining = sum(1 for row in step["grid"] for cell in row if cell == 0)
+            remaining = sum(row.count(0) for row in step["grid"])
             print(f"  📊 Remaining: {remaining} cells")
             print()
 
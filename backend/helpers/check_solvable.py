@@ -1,43 +1,99 @@
+from board.cell import ALL_CANDIDATES_MASK, MASK_DIGITS, MASK_POPCOUNT
+
+
+def _used_masks(board):
+    """
+    Return the digits used in each row, column and box as bitmasks
+    (bit d set for digit d).
+    """
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    for r in range(9):
+        for c in range(9):
+            bit = 1 << board[r][c]
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[(r // 3) * 3 + c // 3] |= bit
+    return rows, cols, boxes
+
+
+def _empty_cells(board):
+    """
+    Return the (row, col, box) of every empty cell, row-major.
+    """
+    return [
+        (r, c, (r // 3) * 3 + c // 3)
+        for r in range(9)
+        for c in range(9)
+        if board[r][c] == 0
+    ]
+
+
 def find_empty_cell_with_fewest_candidates(board):
+    empties = _empty_cells(board)
+    cell = _fewest_candidates(empties, *_used_masks(board))
+    return empties[cell[0]][:2] if cell else None
+
+
+def _fewest_candidates(empties, rows, cols, boxes):
+    """
+    Return (index into empties, candidate mask) of the first empty cell with
+    the fewest candidates, or None if there are no empty cells.
+    """
     min_candidates = 10  # max is 9, so start with something higher
     min_cell = None
-    for r in range(9):
-        for c in range(9):
-            if board[r][c] == 0:
-                candidates = get_candidates(board, r, c)
-                if len(candidates) < min_candidates:
-                    min_candidates = len(candidates)
-                    min_cell = (r, c)
-                if min_candidates == 1:
-                    return min_cell  # best case early exit
+    for k, (r, c, box) in enumerate(empties):
+        mask = ~(rows[r] | cols[c] | boxes[box]) & ALL_CANDIDATES_MASK
+        count = MASK_POPCOUNT[mask]
+        if count < min_candidates:
+            min_candidates = count
+            min_cell = (k, mask)
+            if count <= 1:
+                return min_cell  # forced or dead-end cell, can't do better
     return min_cell
 
 
 def get_candidates(board, row, col):
-    used = set()
-    # row
-    used.update(board[row])
-    # column
-    used.update(board[r][col] for r in range(9))
-    # box
+    # Only the cell's own row, column and box matter for a single lookup
+    used = 0
+    for val in board[row]:
+        used |= 1 << val
+    for r in range(9):
+        used |= 1 << board[r][col]
     start_row = (row // 3) * 3
     start_col = (col // 3) * 3
     for r in range(start_row, start_row + 3):
-        for c in range(start_col, start_col + 3):
-            used.add(board[r][c])
-    return [n for n in range(1, 10) if n not in used]
+        for val in board[r][start_col : start_col + 3]:
+            used |= 1 << val
+    return list(MASK_DIGITS[~used & ALL_CANDIDATES_MASK])
 
 
 def solve(board):
-    cell = find_empty_cell_with_fewest_candidates(board)
+    return _solve(board, _empty_cells(board), *_used_masks(board))
+
+
+def _solve(board, empties, rows, cols, boxes):
+    # rows, cols and boxes track the board's used digits as it is filled in,
+    # so candidates are a few mask operations instead of a rescan with sets;
+    # empties holds only the cells still to fill, so filled ones are never probed
+    cell = _fewest_candidates(empties, rows, cols, boxes)
     if not cell:
         return True  # solved
-    row, col = cell
-    for num in get_candidates(board, row, col):
+    k, mask = cell
+    row, col, box = empties.pop(k)
+    for num in MASK_DIGITS[mask]:
+        bit = 1 << num
         board[row][col] = num
-        if solve(board):
+        rows[row] |= bit
+        cols[col] |= bit
+        boxes[box] |= bit
+        if _solve(board, empties, rows, cols, boxes):
             return True
         board[row][col] = 0  # backtrack
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+    # Put the cell back where it was, keeping the row-major tie-break order
+    empties.insert(k, (row, col, box))
     return False
 
 
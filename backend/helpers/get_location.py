@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def get_column_letter(col_idx):
     """
     Convert zero-based column index to letter (A-I).
@@ -28,6 +31,7 @@ def get_row_number(row_idx):
     return str(row_idx + 1)
 
 
+@lru_cache(maxsize=81)
 def get_cell_location(row_idx, col_idx):
     """
     Convert zero-based row and column indices to cell location string,
@@ -37,6 +41,8 @@ def get_cell_location(row_idx, col_idx):
         row_idx (int): row index (0-8)
         col_idx (int): column index (0-8)
 
+    Results are cached, since there are only 81 distinct cells.
+
     Returns:
         str: location string like 'B1', 'A9', etc.
     """
@@ -7,3 +7,22 @@ def read_puzzle(filename):
                 row = [int(c) for c in line]
                 board.append(row)
     return board
+
+
+# Byte translation for compact puzzles: '1'-'9' to 1-9, '0' and '.' to 0 (empty),
+# anything else to 0xFF so a single max() check rejects it
+_COMPACT_VALUES = bytes(
+    c - 48 if 48 <= c <= 57 else 0 if c == 46 else 0xFF for c in range(256)
+)
+
+
+def parse_compact_puzzle(text):
+    """
+    Parse an 81-character puzzle string, row by row, into a 9x9 grid.
+    Digits 1-9 are givens; '0' or '.' marks an empty cell.
+    Raises ValueError if the string is not in that form.
+    """
+    values = text.encode("latin-1", "replace").translate(_COMPACT_VALUES)
+    if len(values) != 81 or max(values) > 9:
+        raise ValueError("Puzzle must be 81 characters of digits 0-9 or '.'")
+    return [list(values[i : i + 9]) for i in range(0, 81, 9)]
@@ -1,5 +1,9 @@
+from itertools import combinations
+
 from helpers.get_location import get_cell_location
 from models.technique_step import TechniqueStep
+from board.cell import MASK_DIGITS, MASK_POPCOUNT
+from logic.hidden_single import digits_in_exactly_two
 from utils.unit_processor import process_all_units
 
 
@@ -15,7 +19,7 @@ def apply_one_hidden_pair(board):
 
     changed = False
     focus_cells = []
-    elimination_map = {}  # str(candidate) -> list of (r,c)
+    elimination_map = {}  # candidate -> list of (r,c)
 
     def process_unit(cells, positions):
         nonlocal changed, focus_cells, elimination_map
@@ -24,43 +28,57 @@ def apply_one_hidden_pair(board):
         if changed:
             return
 
-        # Map candidate -> set of indices where candidate appears
-        candidate_positions = {n: set() for n in range(1, 10)}
-
-        for idx, cell in enumerate(cells):
-            if not cell.is_solved():
-                for c in cell.get_candidates():
-                    candidate_positions[c].add(idx)
-
-        nums = list(candidate_positions.keys())
-
-        # Find pairs of candidates that appear exactly in the same two positions
-        for i in range(len(nums)):
-            for j in range(i + 1, len(nums)):
-                c1, c2 = nums[i], nums[j]
-                pos1, pos2 = candidate_positions[c1], candidate_positions[c2]
-
-                if len(pos1) == 2 and pos1 == pos2:
-                    # Hidden pair found
-                    for pos in pos1:
-                        cell = cells[pos]
-                        current_candidates = cell.get_candidates()
-                        allowed = {c1, c2}
-                        if not current_candidates.issubset(allowed):
-                            # Eliminate other candidates
-                            eliminated = current_candidates - allowed
-                            new_candidates = current_candidates.intersection(allowed)
-                            cell.set_candidates(new_candidates)
-                            changed = True
-
-                            # Track eliminations
-                            cell_pos = positions[pos]
-                            for v in eliminated:
-                                elimination_map.setdefault(str(v), []).append(cell_pos)
-
-                    # Mark the pair cells for focus/highlight
-                    for pos in pos1:
-                        focus_cells.append(positions[pos])
+        masks = [0 if cell.is_solved() else cell.get_mask() for cell in cells]
+
+        # Only digits confined to exactly two cells can form a hidden pair;
+        # find them for all nine digits at once, as for hidden singles
+        two_cell_mask = digits_in_exactly_two(masks)
+        if MASK_POPCOUNT[two_cell_mask] < 2:
+            return
+        two_cell_digits = MASK_DIGITS[two_cell_mask]
+
+        # Per digit, a bitmask of the unit indices where it is a candidate;
+        # digits sharing the same two cells are grouped by that bitmask
+        candidate_positions = [0] * 10
+        digits_by_positions = {}
+        for c in two_cell_digits:
+            bit = 1 << c
+            for idx, mask in enumerate(masks):
+                if mask & bit:
+                    candidate_positions[c] |= 1 << idx
+            digits_by_positions.setdefault(candidate_positions[c], []).append(c)
+        if len(digits_by_positions) == len(two_cell_digits):
+            return  # no two digits share their cells
+
+        # Pairs of candidates that appear exactly in the same two positions,
+        # in ascending (c1, c2) order
+        pairs = sorted(
+            pair
+            for digits in digits_by_positions.values()
+            if len(digits) > 1
+            for pair in combinations(digits, 2)
+        )
+        for c1, c2 in pairs:
+            # Hidden pair found
+            pos1 = [idx for idx in range(9) if candidate_positions[c1] >> idx & 1]
+            allowed = (1 << c1) | (1 << c2)
+            for pos in pos1:
+                cell = cells[pos]
+                current = cell.get_mask()
+                eliminated = current & ~allowed
+                if eliminated:
+                    # Eliminate other candidates
+                    cell.set_mask(current & allowed)
+                    changed = True
+
+                    # Track eliminations
+                    cell_pos = positions[pos]
+                    for v in MASK_DIGITS[eliminated]:
+                        elimination_map.setdefault(v, []).append(cell_pos)
+
+            # Mark the pair cells for focus/highlight
+            for pos in pos1:
+                focus_cells.append(positions[pos])
 
     # Process all units using shared utility
     process_all_units(board, process_unit)
@@ -74,14 +92,13 @@ def apply_one_hidden_pair(board):
         locs = [get_cell_location(r, c) for (r, c) in poses]
         lines.append(f"Eliminated {cand} from {locs}")
     description = "Hidden Pair elimination:\n" + "\n".join(lines)
-    eliminations = [{k: v} for k, v in elimination_map.items()]
 
     step = TechniqueStep(
         technique="Hidden Pair",
         description=description,
         focus_cells=focus_cells,
         value=None,
-        eliminations=eliminations,
+        eliminations=elimination_map,
     )
     return True, step
 
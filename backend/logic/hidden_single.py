@@ -1,6 +1,79 @@
+from board.board import CELL_UNIT_IDS
 from helpers.get_location import get_cell_location
 from models.technique_step import TechniqueStep
-from utils.unit_processor import process_all_units
+from utils.unit_processor import ALL_UNIT_POSITIONS, process_all_units
+
+
+def find_hidden_single_in_unit(masks):
+    """
+    Find a digit that is a candidate in exactly one of a unit's nine cells.
+    `masks` holds the cells' candidate bitmasks (0 for solved cells).
+    Returns (index into masks, digit), or (None, None) if there is none.
+    """
+    # Count candidate occurrences for all nine digits at once: a bit moves
+    # into seen_more the second time it turns up in the unit
+    seen_once = seen_more = 0
+    for mask in masks:
+        seen_more |= seen_once & mask
+        seen_once |= mask
+    # Hidden single if a candidate appears exactly once (lowest digit first)
+    singles = seen_once & ~seen_more
+    if not singles:
+        return None, None
+    bit = singles & -singles
+    for idx, mask in enumerate(masks):
+        if mask & bit:
+            return idx, bit.bit_length() - 1
+
+
+def digits_in_exactly_two(masks):
+    """
+    Return a bitmask of the digits that are a candidate in exactly two of a
+    unit's cells. `masks` holds the cells' candidate bitmasks (0 for solved).
+    """
+    seen_once = seen_twice = seen_more = 0
+    for mask in masks:
+        seen_more |= seen_twice & mask
+        seen_twice |= seen_once & mask
+        seen_once |= mask
+    return seen_twice & ~seen_more
+
+
+def fill_hidden_single(board, r, c, value):
+    """
+    Place `value` as a hidden single at (r, c) and eliminate it from peers.
+    Returns the TechniqueStep describing the fill.
+    """
+    # Place the hidden single (clears candidates) and eliminate from peers
+    board.grid[r][c].set_value(value)
+    changes = board.update_peers_candidates(r, c, value)
+    # Only peers can lose a candidate, and only `value`
+    eliminated_cells = sorted(divmod(change[0], 9) for change in changes)
+    eliminations = {value: eliminated_cells} if eliminated_cells else {}
+    # Build description
+    loc = get_cell_location(r, c)
+    elimination_text = (
+        "Eliminated: "
+        + "; ".join(
+            f"{cand} from "
+            + ", ".join(get_cell_location(pr, pc) for pr, pc in positions)
+            for cand, positions in eliminations.items()
+        )
+        if eliminations
+        else "No eliminations."
+    )
+    description = (
+        f"Hidden Single in cell {loc}\n"
+        f"Only possible value for this unit is {value}\n"
+        f"Filled {loc}={value}; {elimination_text}"
+    )
+    return TechniqueStep(
+        technique="Hidden Single",
+        description=description,
+        focus_cells=[(r, c)],
+        value=value,
+        eliminations=eliminations,
+    )
 
 
 def apply_one_hidden_single(board):
@@ -12,78 +85,17 @@ def apply_one_hidden_single(board):
     """
     board.update_candidates()
 
-    def find_hidden_single_in_unit(cells):
-        # Count candidate occurrences in the unit
-        candidate_positions = {n: [] for n in range(1, 10)}
-        for idx, cell in enumerate(cells):
-            if not cell.is_solved():
-                for c in cell.get_candidates():
-                    candidate_positions[c].append(idx)
-        # Hidden single if a candidate appears exactly once
-        for num, positions in candidate_positions.items():
-            if len(positions) == 1:
-                return positions[0], num
-        return None, None
-
-    def create_step(r, c, value):
-        # Snapshot full-board candidates before elimination
-        prev = {
-            (pr, pc): board.get_candidates_grid()[pr][pc].copy()
-            for pr in range(9)
-            for pc in range(9)
-        }
-        # Place the hidden single
-        board.grid[r][c].set_value(value)
-        board.grid[r][c].set_candidates(set())
-        board.update_peers_candidates(r, c, value)
-        # Compute eliminations
-        elim_map = {}
-        for pr in range(9):
-            for pc in range(9):
-                if (pr, pc) == (r, c):
-                    continue
-                before = prev[(pr, pc)]
-                after = board.grid[pr][pc].get_candidates()
-                removed = before - after
-                for v in removed:
-                    elim_map.setdefault(str(v), []).append((pr, pc))
-        eliminations = [{k: v} for k, v in elim_map.items()]
-        # Build description
-        loc = get_cell_location(r, c)
-        elimination_text = (
-            "Eliminated: "
-            + "; ".join(
-                f"{cand} from "
-                + ", ".join(get_cell_location(pr, pc) for pr, pc in positions)
-                for entry in eliminations
-                for cand, positions in entry.items()
-            )
-            if eliminations
-            else "No eliminations."
-        )
-        description = (
-            f"Hidden Single in cell {loc}\n"
-            f"Only possible value for this unit is {value}\n"
-            f"Filled {loc}={value}; {elimination_text}"
-        )
-        return TechniqueStep(
-            technique="Hidden Single",
-            description=description,
-            focus_cells=[(r, c)],
-            value=value,
-            eliminations=eliminations,
-        )
-
     # Track if we found a hidden single
     found_result = [None]  # Use list to allow modification in nested function
 
     def process_unit(cells, positions):
         if found_result[0] is not None:  # Already found one, skip processing
             return
-        pos, value = find_hidden_single_in_unit(cells)
+        masks = [0 if cell.is_solved() else cell.get_mask() for cell in cells]
+        pos, value = find_hidden_single_in_unit(masks)
         if pos is not None:
             r, c = positions[pos]
-            found_result[0] = (True, create_step(r, c, value))
+            found_result[0] = (True, fill_hidden_single(board, r, c, value))
 
     # Process all units using shared utility
     process_all_units(board, process_unit)
@@ -101,12 +113,31 @@ def apply_all_hidden_singles(board):
     Returns:
       changed (bool), steps (list of TechniqueStep)
     """
-    changed = False
+    # Fills the same cells in the same order as calling apply_one_hidden_single
+    # until it finds nothing, but refreshes candidates once (each fill already
+    # removes its value from the peers) and rescans only the units a fill
+    # changed: the others still have no hidden single
+    board.update_candidates()
     steps = []
-    while True:
-        step_changed, step = apply_one_hidden_single(board)
-        if not step_changed:
-            break
-        changed = True
+    clear_units = set()  # unit ids known to hold no hidden single
+    unit_id = 0
+    while unit_id < 27:
+        if unit_id in clear_units:
+            unit_id += 1
+            continue
+        masks = [
+            0 if cell.is_solved() else cell.get_mask() for cell in board.units[unit_id]
+        ]
+        pos, value = find_hidden_single_in_unit(masks)
+        if pos is None:
+            clear_units.add(unit_id)
+            unit_id += 1
+            continue
+        r, c = ALL_UNIT_POSITIONS[unit_id][pos]
+        step = fill_hidden_single(board, r, c, value)
         steps.append(step)
-    return changed, steps
+        # The filled cell and the peers that lost `value` changed their units
+        for pr, pc in [(r, c)] + step.eliminations.get(value, []):
+            clear_units.difference_update(CELL_UNIT_IDS[9 * pr + pc])
+        unit_id = 0
+    return bool(steps), steps
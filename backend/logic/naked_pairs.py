@@ -1,5 +1,6 @@
 from helpers.get_location import get_cell_location
 from models.technique_step import TechniqueStep
+from board.cell import MASK_DIGITS, MASK_POPCOUNT
 from utils.unit_processor import process_all_units
 
 
@@ -14,37 +15,33 @@ def apply_one_naked_pair(board):
     # TODO: might remove as the technique should already eleimante candidates
     board.update_candidates()
 
-    # Snapshot candidates before elimination
-    prev_candidates = board.get_candidates_grid()
     changed = False
     focus_cells = []
-    elimination_map = {}  # str(candidate) -> list of (r,c)
+    elimination_map = {}  # candidate -> list of (r,c)
 
     def process_unit(cells, positions):
         nonlocal changed, focus_cells, elimination_map
-        # Find all cells with exactly 2 candidates
+        # Find all cells with exactly 2 candidates, keyed by candidate mask
         pairs = {}
         for idx, cell in enumerate(cells):
             if not cell.is_solved():
-                cands = cell.get_candidates()
-                if len(cands) == 2:
-                    key = tuple(sorted(cands))
-                    pairs.setdefault(key, []).append(idx)
+                mask = cell.get_mask()
+                if MASK_POPCOUNT[mask] == 2:
+                    pairs.setdefault(mask, []).append(idx)
         # For each candidate pair that appears in exactly two cells
-        for key, idxs in pairs.items():
+        for pair_mask, idxs in pairs.items():
             if len(idxs) == 2:
-                to_remove = set(key)
                 # Eliminate from other cells in unit
                 for idx, cell in enumerate(cells):
                     if idx not in idxs and not cell.is_solved():
-                        old = cell.get_candidates()
-                        new = old - to_remove
-                        if new != old:
-                            cell.set_candidates(new)
+                        old = cell.get_mask()
+                        removed = old & pair_mask
+                        if removed:
+                            cell.set_mask(old ^ removed)
                             changed = True
                             pos = positions[idx]
-                            for v in old - new:
-                                elimination_map.setdefault(str(v), []).append(pos)
+                            for v in MASK_DIGITS[removed]:
+                                elimination_map.setdefault(v, []).append(pos)
                 # Mark the pair cells for focus/highlight
                 for idx in idxs:
                     focus_cells.append(positions[idx])
@@ -61,14 +58,13 @@ def apply_one_naked_pair(board):
         locs = [get_cell_location(r, c) for (r, c) in poses]
         lines.append(f"Eliminated {cand} from {locs}")
     description = "Naked Pair elimination:\n" + "\n".join(lines)
-    eliminations = [{k: v} for k, v in elimination_map.items()]
 
     step = TechniqueStep(
         technique="Naked Pair",
         description=description,
         focus_cells=focus_cells,
         value=None,
-        eliminations=eliminations,
+        eliminations=elimination_map,
     )
     return True, step
 
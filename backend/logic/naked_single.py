@@ -1,7 +1,49 @@
+from board.board import PEERS
 from helpers.get_location import get_cell_location
 from models.technique_step import TechniqueStep
 
 
+def fill_naked_single(board, r, c, value):
+    """
+    Place `value` as a naked single at (r, c) and eliminate it from peers.
+    Returns the TechniqueStep describing the fill.
+    """
+    # Place the value (clears candidates) and eliminate from peers
+    board.grid[r][c].set_value(value)
+    changes = board.update_peers_candidates(r, c, value)
+
+    # Only peers can lose a candidate, and only `value`
+    eliminated_cells = sorted(divmod(change[0], 9) for change in changes)
+    eliminations = {value: eliminated_cells} if eliminated_cells else {}
+
+    # Build human-readable description
+    loc_str = get_cell_location(r, c)
+    description = (
+        f"Naked Single in cell {loc_str}\n"
+        f"Only candidate is {value}\n"
+        f"Filled {loc_str}={value}; "
+        + (
+            "Eliminated: "
+            + "; ".join(
+                f"{cand} from "
+                + ", ".join(get_cell_location(pr, pc) for pr, pc in cells)
+                for cand, cells in eliminations.items()
+            )
+            if eliminations
+            else "No eliminations needed."
+        )
+    )
+
+    # Create step object
+    return TechniqueStep(
+        technique="Naked Single",
+        description=description,
+        focus_cells=[(r, c)],
+        value=value,
+        eliminations=eliminations,
+    )
+
+
 def apply_one_naked_single(board):
     """
     Apply naked single technique once on the board.
@@ -16,65 +58,9 @@ def apply_one_naked_single(board):
         for c in range(9):
             cell = board.grid[r][c]
             if not cell.is_solved():
-                candidates = cell.get_candidates()
                 # Naked single found
-                if len(candidates) == 1:
-                    value = next(iter(candidates))
-                    # Snapshot full-board candidates before elimination
-                    prev_candidates = {
-                        (pr, pc): board.get_candidates_grid()[pr][pc].copy()
-                        for pr in range(9)
-                        for pc in range(9)
-                    }
-                    # Place the value and clear candidates
-                    cell.set_value(value)
-                    cell.set_candidates(set())
-                    # Eliminate from peers
-                    board.update_peers_candidates(r, c, value)
-
-                    # Compute exactly which candidates were removed
-                    elimination_map = {}
-                    for pr in range(9):
-                        for pc in range(9):
-                            if (pr, pc) == (r, c):
-                                continue
-                            before = prev_candidates[(pr, pc)]
-                            after = board.grid[pr][pc].get_candidates()
-                            removed = before - after
-                            for v in removed:
-                                elimination_map.setdefault(str(v), []).append((pr, pc))
-                    eliminations = [{k: v} for k, v in elimination_map.items()]
-
-                    # Build human-readable description
-                    loc_str = get_cell_location(r, c)
-                    description = (
-                        f"Naked Single in cell {loc_str}\n"
-                        f"Only candidate is {value}\n"
-                        f"Filled {loc_str}={value}; "
-                        + (
-                            "Eliminated: "
-                            + "; ".join(
-                                f"{cand} from "
-                                + ", ".join(
-                                    get_cell_location(pr, pc) for pr, pc in cells
-                                )
-                                for e in eliminations
-                                for cand, cells in e.items()
-                            )
-                            if eliminations
-                            else "No eliminations needed."
-                        )
-                    )
-
-                    # Create step object
-                    step = TechniqueStep(
-                        technique="Naked Single",
-                        description=description,
-                        focus_cells=[(r, c)],
-                        value=value,
-                        eliminations=eliminations,
-                    )
-                    return True, step
+                if cell.candidate_count() == 1:
+                    return True, fill_naked_single(board, r, c, cell.only_candidate())
     # No naked single found
     return False, None
 
@@ -86,12 +72,30 @@ def apply_all_naked_singles(board):
       changed (bool): True if any cell was filled during the process
       steps (list): List of TechniqueStep objects for each fill
     """
-    changed = False
+    # Fills the same cells in the same order as calling apply_one_naked_single
+    # until it finds nothing, but refreshes candidates once: each fill already
+    # removes its value from the peers, and the scan resumes rather than
+    # restarting from R1C1
+    board.update_candidates()
+    cells = board.cells
     steps = []
-    while True:
-        step_changed, step = apply_one_naked_single(board)
-        if not step_changed:
-            break
-        changed = True
-        steps.append(step)
-    return changed, steps
+    i = 0
+    while i < 81:
+        cell = cells[i]
+        if cell.is_solved() or cell.candidate_count() != 1:
+            i += 1
+            continue
+        steps.append(fill_naked_single(board, *divmod(i, 9), cell.only_candidate()))
+        # No earlier cell was a naked single, and only this cell's peers lost
+        # a candidate, so the next one is an earlier peer or after this cell
+        i = min(
+            (
+                j
+                for j in PEERS[i]
+                if j < i
+                and not cells[j].is_solved()
+                and cells[j].candidate_count() == 1
+            ),
+            default=i + 1,
+        )
+    return bool(steps), steps
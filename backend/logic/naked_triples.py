@@ -1,5 +1,6 @@
 from helpers.get_location import get_cell_location
 from models.technique_step import TechniqueStep
+from board.cell import MASK_DIGITS, MASK_POPCOUNT
 from utils.unit_processor import process_all_units
 
 
@@ -15,7 +16,7 @@ def apply_one_naked_triple(board):
 
     changed = False
     focus_cells = []
-    elimination_map = {}  # str(candidate) -> list of (r,c)
+    elimination_map = {}  # candidate -> list of (r,c)
 
     def process_unit(cells, positions):
         nonlocal changed, focus_cells, elimination_map
@@ -25,14 +26,14 @@ def apply_one_naked_triple(board):
             return
 
         # Find all cells with 2 or 3 candidates (naked triples can have 2-3 candidates each)
-        candidate_cells = {}  # frozenset(candidates) -> list of indices
+        candidate_cells = {}  # candidate mask -> list of indices
 
         for idx, cell in enumerate(cells):
             if not cell.is_solved():
-                cands = cell.get_candidates()
-                if 1 <= len(cands) <= 3:  # Naked triples have 1-3 candidates per cell
-                    key = frozenset(cands)
-                    candidate_cells.setdefault(key, []).append(idx)
+                mask = cell.get_mask()
+                # Naked triples have 1-3 candidates per cell
+                if 1 <= MASK_POPCOUNT[mask] <= 3:
+                    candidate_cells.setdefault(mask, []).append(idx)
 
         # Find all possible combinations of 3 cells
         cell_indices = []
@@ -49,42 +50,33 @@ def apply_one_naked_triple(board):
 
         for triple_indices in combinations(unique_indices, 3):
             # Get the union of all candidates in these 3 cells
-            all_candidates = set()
+            triple_mask = 0
             for idx in triple_indices:
-                all_candidates.update(cells[idx].get_candidates())
-
-            # Naked triple: exactly 3 candidates across exactly 3 cells
-            if len(all_candidates) == 3:
-                # Verify each cell's candidates are a subset of the triple
-                is_naked_triple = True
-                for idx in triple_indices:
-                    cell_candidates = cells[idx].get_candidates()
-                    if not cell_candidates.issubset(all_candidates):
-                        is_naked_triple = False
-                        break
-
-                if is_naked_triple:
-                    # Found a naked triple! Eliminate these candidates from other cells
-                    to_remove = all_candidates
-                    local_changed = False
-
-                    for idx, cell in enumerate(cells):
-                        if idx not in triple_indices and not cell.is_solved():
-                            old = cell.get_candidates()
-                            new = old - to_remove
-                            if new != old:
-                                cell.set_candidates(new)
-                                changed = True
-                                local_changed = True
-                                pos = positions[idx]
-                                for v in old - new:
-                                    elimination_map.setdefault(str(v), []).append(pos)
-
-                    # Mark the triple cells for focus/highlight (only if we made changes)
-                    if local_changed:
-                        for idx in triple_indices:
-                            focus_cells.append(positions[idx])
-                        return  # Only process one triple per call
+                triple_mask |= cells[idx].get_mask()
+
+            # Naked triple: exactly 3 candidates across exactly 3 cells (each
+            # cell's candidates are then a subset of the triple by construction)
+            if MASK_POPCOUNT[triple_mask] == 3:
+                # Found a naked triple! Eliminate these candidates from other cells
+                local_changed = False
+
+                for idx, cell in enumerate(cells):
+                    if idx not in triple_indices and not cell.is_solved():
+                        old = cell.get_mask()
+                        removed = old & triple_mask
+                        if removed:
+                            cell.set_mask(old ^ removed)
+                            changed = True
+                            local_changed = True
+                            pos = positions[idx]
+                            for v in MASK_DIGITS[removed]:
+                                elimination_map.setdefault(v, []).append(pos)
+
+                # Mark the triple cells for focus/highlight (only if we made changes)
+                if local_changed:
+                    for idx in triple_indices:
+                        focus_cells.append(positions[idx])
+                    return  # Only process one triple per call
 
     # Process all units using shared utility
     process_all_units(board, process_unit)
@@ -98,14 +90,13 @@ def apply_one_naked_triple(board):
         locs = [get_cell_location(r, c) for (r, c) in poses]
         lines.append(f"Eliminated {cand} from {locs}")
     description = "Naked Triple elimination:\n" + "\n".join(lines)
-    eliminations = [{k: v} for k, v in elimination_map.items()]
 
     step = TechniqueStep(
         technique="Naked Triple",
         description=description,
         focus_cells=focus_cells,
         value=None,
-        eliminations=eliminations,
+        eliminations=elimination_map,
     )
     return True, step
 
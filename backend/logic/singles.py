@@ -0,0 +1,46 @@
+from board.board import UNITS
+from board.cell import MASK_POPCOUNT
+from logic.naked_single import fill_naked_single
+from logic.hidden_single import find_hidden_single_in_unit, fill_hidden_single
+
+
+def apply_one_single(board):
+    """
+    Apply one naked or hidden single in a single sweep over the units.
+    Finds the same cell as apply_one_naked_single followed, if that finds
+    nothing, by apply_one_hidden_single, but refreshes candidates and reads
+    each unit's masks only once.
+    Returns:
+      changed (bool): True if a cell was filled
+      step (TechniqueStep): Detailed information for this step (or None if no fill)
+    """
+    board.update_candidates()
+    hidden = None
+
+    # Rows cover every cell in row-major order, so they are where the naked
+    # single scan happens; each row's masks also feed the hidden single check
+    for unit, unit_cells in zip(UNITS[:9], board.units[:9]):
+        masks = [0 if cell.is_solved() else cell.get_mask() for cell in unit_cells]
+        for idx, mask in enumerate(masks):
+            if MASK_POPCOUNT[mask] == 1:
+                return True, fill_naked_single(
+                    board, *divmod(unit[idx], 9), mask.bit_length() - 1
+                )
+        if hidden is None:
+            pos, value = find_hidden_single_in_unit(masks)
+            if pos is not None:
+                hidden = (unit[pos], value)
+
+    # No naked single anywhere: columns and boxes only matter for hidden ones
+    if hidden is None:
+        for unit, unit_cells in zip(UNITS[9:], board.units[9:]):
+            masks = [0 if cell.is_solved() else cell.get_mask() for cell in unit_cells]
+            pos, value = find_hidden_single_in_unit(masks)
+            if pos is not None:
+                hidden = (unit[pos], value)
+                break
+
+    if hidden is None:
+        return False, None
+    cell_idx, value = hidden
+    return True, fill_hidden_single(board, *divmod(cell_idx, 9), value)
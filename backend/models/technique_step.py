@@ -1,4 +1,19 @@
+# Bumped when the shape of to_dict() changes
+# 2: eliminations is one {candidate: [cell, ...]} dict, not a list of one-key dicts
+SCHEMA_VERSION = 2
+
+
 class TechniqueStep:
+    # Fixed attribute layout: no per-step __dict__
+    __slots__ = (
+        "technique",
+        "description",
+        "focus_cells",
+        "value",
+        "eliminations",
+        "extra",
+    )
+
     def __init__(
         self,
         technique,
@@ -13,14 +28,14 @@ class TechniqueStep:
         description: str -- Human-readable explanation
         focus_cells: list of (row, col) -- List of all cells directly involved, usually length 1 for singles
         value: int -- The value placed (if any)
-        eliminations: list of dicts -- Each {candidate: [cell, ...]}, eliminated in this step
+        eliminations: dict -- {candidate: [cell, ...]} for every candidate eliminated in this step
         extra: Optional, for additional technique-specific info
         """
         self.technique = technique
         self.description = description
         self.focus_cells = focus_cells
         self.value = value
-        self.eliminations = eliminations or []
+        self.eliminations = eliminations or {}
         self.extra = extra
 
     def to_dict(self):
@@ -31,4 +46,5 @@ class TechniqueStep:
             "value": self.value,
             "eliminations": self.eliminations,
             "extra": self.extra,
+            "schema_version": SCHEMA_VERSION,
         }
@@ -5,8 +5,7 @@ Advanced Sudoku solver that distinguishes between:
 """
 
 from typing import Dict, Any, List, Tuple, Set
-import copy
-from board.board import SudokuBoard
+from board.board import SudokuBoard, format_candidate_change
 from logic.naked_single import apply_all_naked_singles
 from logic.hidden_single import apply_all_hidden_singles
 from logic.hidden_pairs import apply_all_hidden_pairs
@@ -30,13 +29,15 @@ class AdvancedSudokuSolver:
             ("Naked Pairs", apply_all_naked_pairs),
         ]
 
-    def apply_basic_constraints(self, board: SudokuBoard) -> List[Dict]:
+    def apply_basic_constraints(
+        self, board: SudokuBoard
+    ) -> List[Tuple[int, int, int, int]]:
         """
         Apply basic constraint propagation (Type 1).
         Eliminates candidates based on filled cells in rows, columns, and boxes.
 
         Returns:
-            List of candidate changes made by constraint propagation
+            List of (cell_idx, eliminated_mask, old_mask, new_mask) change records
         """
         return board.update_candidates()
 
@@ -58,7 +59,7 @@ class AdvancedSudokuSolver:
         before_candidates = board.get_candidates_grid()
 
         # Apply the technique
-        technique_applied = technique_func(board)
+        technique_applied, _ = technique_func(board)
 
         # Find what the technique eliminated (before constraint propagation)
         after_candidates = board.get_candidates_grid()
@@ -93,10 +94,8 @@ class AdvancedSudokuSolver:
         solving_steps = []
 
         # Initial state
-        initial_grid = [[cell.get_value() for cell in row] for row in board.grid]
-        initial_empty_count = sum(
-            1 for row in initial_grid for cell in row if cell == 0
-        )
+        initial_grid = board.export_values()
+        initial_empty_count = sum(row.count(0) for row in initial_grid)
 
         # Step 1: Initial constraint propagation
         constraint_changes = self.apply_basic_constraints(board)
@@ -104,10 +103,8 @@ class AdvancedSudokuSolver:
         if constraint_changes:
             solving_steps.append(
                 {
-                    "grid": copy.deepcopy(
-                        [[cell.get_value() for cell in row] for row in board.grid]
-                    ),
-                    "candidates": copy.deepcopy(board.get_candidates_grid()),
+                    "grid": board.export_values(),
+                    "candidates": board.get_candidates_grid(),
                     "technique": "Initial Constraint Propagation",
                     "technique_type": "constraint_propagation",
                     "description": f"Applied basic row/column/box constraints to starting puzzle with {initial_empty_count} empty cells",
@@ -130,10 +127,8 @@ class AdvancedSudokuSolver:
 
             for technique_name, technique_func in self.techniques:
                 # Save grid state before applying technique
-                before_grid = [[cell.get_value() for cell in row] for row in board.grid]
-                before_solved_count = sum(
-                    1 for row in before_grid for cell in row if cell != 0
-                )
+                before_grid = board.export_values()
+                before_solved_count = 81 - sum(row.count(0) for row in before_grid)
 
                 # Apply the technique (Type 2: Advanced eliminations)
                 technique_applied, technique_changes = (
@@ -151,12 +146,8 @@ class AdvancedSudokuSolver:
                     constraint_changes = self.apply_basic_constraints(board)
 
                     # Get final state
-                    after_grid = [
-                        [cell.get_value() for cell in row] for row in board.grid
-                    ]
-                    after_solved_count = sum(
-                        1 for row in after_grid for cell in row if cell != 0
-                    )
+                    after_grid = board.export_values()
+                    after_solved_count = 81 - sum(row.count(0) for row in after_grid)
                     cells_solved = after_solved_count - before_solved_count
 
                     # Find which cells were solved
@@ -173,9 +164,7 @@ class AdvancedSudokuSolver:
                         constraint_changes
                     )
 
-                    remaining_empty = sum(
-                        1 for row in after_grid for cell in row if cell == 0
-                    )
+                    remaining_empty = sum(row.count(0) for row in after_grid)
 
                     # Create description
                     description = self._create_step_description(
@@ -189,8 +178,8 @@ class AdvancedSudokuSolver:
 
                     solving_steps.append(
                         {
-                            "grid": copy.deepcopy(after_grid),
-                            "candidates": copy.deepcopy(board.get_candidates_grid()),
+                            "grid": after_grid,
+                            "candidates": board.get_candidates_grid(),
                             "technique": technique_name,
                             "technique_type": "solving_technique",
                             "description": description,
@@ -205,15 +194,15 @@ class AdvancedSudokuSolver:
                     step_number += 1
 
         # Final state
-        solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+        solved_grid = board.export_values()
 
         if solving_steps and not board.is_solved():
-            final_empty = sum(1 for row in solved_grid for cell in row if cell == 0)
+            final_empty = sum(row.count(0) for row in solved_grid)
             if final_empty > 0:
                 solving_steps.append(
                     {
-                        "grid": copy.deepcopy(solved_grid),
-                        "candidates": copy.deepcopy(board.get_candidates_grid()),
+                        "grid": solved_grid,
+                        "candidates": board.get_candidates_grid(),
                         "technique": "Final State",
                         "technique_type": "final",
                         "description": f"Solving completed. {final_empty} cells could not be solved with available techniques.",
@@ -227,7 +216,7 @@ class AdvancedSudokuSolver:
         if board.is_solved():
             message = f"Puzzle solved successfully in {step_number-1} steps using {len(techniques_applied)} technique(s)!"
         else:
-            empty_cells = sum(1 for row in solved_grid for cell in row if cell == 0)
+            empty_cells = sum(row.count(0) for row in solved_grid)
             message = f"Partial solution: {empty_cells} cells remaining after {step_number-1} steps and {len(techniques_applied)} technique(s)"
 
         return {
@@ -239,20 +228,15 @@ class AdvancedSudokuSolver:
             "solving_steps": solving_steps,
         }
 
-    def _format_constraint_changes(self, constraint_changes: List[Dict]) -> List[Dict]:
-        """Format constraint propagation changes to match technique changes format."""
+    def _format_constraint_changes(
+        self, constraint_changes: List[Tuple[int, int, int, int]]
+    ) -> List[Dict]:
+        """Expand constraint propagation change records to match technique changes format."""
         formatted = []
         for change in constraint_changes:
-            formatted.append(
-                {
-                    "position": change["position"],
-                    "location": change["location"],
-                    "eliminated": change["eliminated"],
-                    "old_candidates": change["old_candidates"],
-                    "new_candidates": change["new_candidates"],
-                    "elimination_type": "constraint_propagation",
-                }
-            )
+            formatted_change = format_candidate_change(change)
+            formatted_change["elimination_type"] = "constraint_propagation"
+            formatted.append(formatted_change)
         return formatted
 
     def _create_step_description(
@@ -3,9 +3,15 @@ Enhanced Sudoku solver service that tracks both cell placements and candidate el
 This provides a more detailed step-by-step solving process.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Set
-import copy
-from board.board import SudokuBoard
+from board.board import (
+    SudokuBoard,
+    format_candidate_change,
+    snapshot_fingerprint,
+    snapshot_to_candidates,
+    snapshot_to_grid,
+)
 from logic.naked_single import apply_all_naked_singles
 from logic.hidden_single import apply_all_hidden_singles
 from logic.hidden_pairs import apply_all_hidden_pairs
@@ -49,21 +55,22 @@ class EnhancedSudokuSolver:
         board = SudokuBoard(puzzle)
         techniques_applied = []
         solving_steps = []
+        # Candidate rows shared between steps whose rows are unchanged
+        candidate_rows = {}
 
         # Add initial state with more details
-        initial_grid = [[cell.get_value() for cell in row] for row in board.grid]
-        initial_candidates = board.get_candidates_grid()
-        initial_empty_count = sum(
-            1 for row in initial_grid for cell in row if cell == 0
-        )
+        initial_vals, initial_masks = board.snapshot()
+        initial_empty_count = initial_vals.count(0)
 
         # Update candidates for initial state
-        candidate_changes = board.update_candidates()
+        candidate_changes = [
+            format_candidate_change(change) for change in board.update_candidates()
+        ]
 
         solving_steps.append(
             {
-                "grid": copy.deepcopy(initial_grid),
-                "candidates": copy.deepcopy(initial_candidates),
+                "grid": snapshot_to_grid(initial_vals),
+                "candidates": snapshot_to_candidates(initial_masks, candidate_rows),
                 "technique": "Initial State",
                 "description": f"Starting puzzle with {initial_empty_count} empty cells",
                 "cells_solved": 0,
@@ -72,6 +79,13 @@ class EnhancedSudokuSolver:
             }
         )
 
+        # Board state as of the last step; each technique's "before" is the
+        # previous "after", so the board is snapshotted once per step
+        last_vals, last_masks = board.snapshot()
+        # Board fingerprint -> techniques already run on that exact state
+        # without changing it; running them again would change nothing either
+        idle_techniques: Dict[int, Set[str]] = {}
+
         changed = True
         iteration = 0
         step_number = 1
@@ -81,70 +95,41 @@ class EnhancedSudokuSolver:
             iteration += 1
 
             for technique_name, technique_func in self.techniques:
-                # Save grid state before applying technique
-                before_grid = [[cell.get_value() for cell in row] for row in board.grid]
-                before_candidates = board.get_candidates_grid()
-                before_solved_count = sum(
-                    1 for row in before_grid for cell in row if cell != 0
-                )
+                before_vals, before_masks = last_vals, last_masks
+                fingerprint = snapshot_fingerprint(before_vals, before_masks)
+                # Already run on this exact state without changing it
+                if technique_name in idle_techniques.get(fingerprint, ()):
+                    continue
 
-                # Apply technique
-                technique_applied = technique_func(board)
+                technique_applied, _ = technique_func(board)
+                if not technique_applied:
+                    idle_techniques.setdefault(fingerprint, set()).add(technique_name)
 
                 if technique_applied:
                     changed = True
                     if technique_name not in techniques_applied:
                         techniques_applied.append(technique_name)
 
-                    # Save grid state after applying technique
-                    after_grid = [
-                        [cell.get_value() for cell in row] for row in board.grid
-                    ]
-                    after_candidates = board.get_candidates_grid()
-                    after_solved_count = sum(
-                        1 for row in after_grid for cell in row if cell != 0
-                    )
-                    cells_solved = after_solved_count - before_solved_count
+                    # Save board state after applying technique
+                    after_vals, after_masks = board.snapshot()
+                    last_vals, last_masks = after_vals, after_masks
 
                     # Find which cells were solved
-                    solved_positions = []
-                    for row in range(9):
-                        for col in range(9):
-                            if before_grid[row][col] == 0 and after_grid[row][col] != 0:
-                                solved_positions.append(
-                                    f"{get_cell_location(row, col)}={after_grid[row][col]}"
-                                )
+                    solved_positions = [
+                        f"{get_cell_location(*divmod(i, 9))}={after_vals[i]}"
+                        for i in range(81)
+                        if before_vals[i] == 0 and after_vals[i] != 0
+                    ]
+                    cells_solved = len(solved_positions)
 
-                    # Find candidate changes
-                    candidate_changes = []
-                    for row in range(9):
-                        for col in range(9):
-                            if (
-                                before_candidates[row][col]
-                                != after_candidates[row][col]
-                            ):
-                                eliminated = (
-                                    before_candidates[row][col]
-                                    - after_candidates[row][col]
-                                )
-                                if eliminated:
-                                    candidate_changes.append(
-                                        {
-                                            "position": (row, col),
-                                            "location": get_cell_location(row, col),
-                                            "eliminated": eliminated,
-                                            "old_candidates": before_candidates[row][
-                                                col
-                                            ],
-                                            "new_candidates": after_candidates[row][
-                                                col
-                                            ],
-                                        }
-                                    )
-
-                    remaining_empty = sum(
-                        1 for row in after_grid for cell in row if cell == 0
-                    )
+                    # Find candidate changes: only cells whose mask lost bits
+                    candidate_changes = [
+                        format_candidate_change((i, old & ~new, old, new))
+                        for i, (old, new) in enumerate(zip(before_masks, after_masks))
+                        if old & ~new
+                    ]
+
+                    remaining_empty = after_vals.count(0)
 
                     # Create description based on what happened
                     if cells_solved > 0:
@@ -170,8 +155,10 @@ class EnhancedSudokuSolver:
 
                     solving_steps.append(
                         {
-                            "grid": copy.deepcopy(after_grid),
-                            "candidates": copy.deepcopy(after_candidates),
+                            "grid": snapshot_to_grid(after_vals),
+                            "candidates": snapshot_to_candidates(
+                                after_masks, candidate_rows
+                            ),
                             "technique": technique_name,
                             "description": description,
                             "cells_solved": cells_solved,
@@ -183,16 +170,18 @@ class EnhancedSudokuSolver:
                     step_number += 1
 
         # Convert board back to grid format for final state
-        solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+        solved_grid = board.export_values()
 
         # Add final state if different from last step
         if solving_steps and not board.is_solved():
-            final_empty = sum(1 for row in solved_grid for cell in row if cell == 0)
+            final_empty = sum(row.count(0) for row in solved_grid)
             if final_empty > 0:
                 solving_steps.append(
                     {
-                        "grid": copy.deepcopy(solved_grid),
-                        "candidates": copy.deepcopy(board.get_candidates_grid()),
+                        "grid": solved_grid,
+                        "candidates": snapshot_to_candidates(
+                            board.get_candidates_bitmask(), candidate_rows
+                        ),
                         "technique": "Final State",
                         "description": f"Solving completed. {final_empty} cells could not be solved with available techniques.",
                         "cells_solved": 0,
@@ -205,7 +194,7 @@ class EnhancedSudokuSolver:
         if board.is_solved():
             message = f"Puzzle solved successfully in {step_number-1} steps using {len(techniques_applied)} technique(s)!"
         else:
-            empty_cells = sum(1 for row in solved_grid for cell in row if cell == 0)
+            empty_cells = sum(row.count(0) for row in solved_grid)
             message = f"Partial solution: {empty_cells} cells remaining after {step_number-1} steps and {len(techniques_applied)} technique(s)"
 
         return {
@@ -229,3 +218,37 @@ class EnhancedSudokuSolver:
 
 # Global solver instance
 enhanced_solver = EnhancedSudokuSolver()
+
+
+@lru_cache(maxsize=256)
+def _solve_cached(puzzle_key: Tuple[Tuple[int, ...], ...]) -> Dict[str, Any]:
+    """Solve a puzzle given as a tuple of row tuples, memoizing the result."""
+    return enhanced_solver.solve([list(row) for row in puzzle_key])
+
+
+def _copy_step(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached step down to its innermost lists and dicts."""
+    step = dict(step)
+    step["grid"] = [row[:] for row in step["grid"]]
+    step["candidates"] = [[cell[:] for cell in row] for row in step["candidates"]]
+    step["candidate_changes"] = [dict(change) for change in step["candidate_changes"]]
+    if "solved_positions" in step:
+        step["solved_positions"] = step["solved_positions"][:]
+    return step
+
+
+def solve_cached(puzzle: List[List[int]]) -> Dict[str, Any]:
+    """
+    Like enhanced_solver.solve, but repeated puzzles are served from a cache.
+
+    Every list and dict in the result is a fresh copy, so callers can change
+    it freely without affecting later calls. The cache is _solve_cached; use
+    its cache_info() and cache_clear() to inspect or reset it.
+    """
+    result = _solve_cached(tuple(map(tuple, puzzle)))
+    return {
+        **result,
+        "solved_grid": [row[:] for row in result["solved_grid"]],
+        "techniques_applied": result["techniques_applied"][:],
+        "solving_steps": [_copy_step(step) for step in result["solving_steps"]],
+    }
@@ -5,9 +5,9 @@ Frontend-optimized Sudoku solver that separates solving into clear, distinct ste
 3. Advanced Elimination Step: Shows candidates eliminated by advanced techniques
 """
 
-from typing import Dict, Any, List, Tuple, Set
-import copy
-from board.board import SudokuBoard
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Set
+from board.board import SudokuBoard, format_candidate_change
+from board.cell import MASK_DIGITS
 from logic.naked_single import apply_all_naked_singles
 from logic.hidden_single import apply_all_hidden_singles
 from logic.hidden_pairs import apply_all_hidden_pairs
@@ -16,6 +16,39 @@ from logic.naked_triples import apply_all_naked_triples
 from helpers.get_location import get_cell_location
 from config.settings import settings
 
+# Educational explanation shown for each technique
+_TECHNIQUE_EXPLANATIONS = {
+    "Naked Singles": "When a cell has only one possible candidate remaining, that candidate must be the solution",
+    "Hidden Singles": "When a candidate appears only once within a row, column, or box, it must go in that cell",
+    "Hidden Pairs": "When two candidates appear only in the same two cells within a unit, other candidates can be eliminated from those cells",
+    "Naked Pairs": "When two cells in a unit contain the same two candidates, those candidates can be eliminated from other cells in that unit",
+    "Naked Triples": "When three cells in a unit contain the same three candidates between them, those candidates can be eliminated from other cells in that unit",
+    "Initial Setup": "Basic Sudoku constraints eliminate candidates that would violate row, column, or box rules",
+}
+
+# Technique step description suffix keyed by (cells solved?, candidates eliminated?)
+_DESCRIPTION_SUFFIXES = {
+    (True, True): " filled {cells} cell(s) and eliminated {eliminations} candidate(s)",
+    (True, False): " filled {cells} cell(s)",
+    (False, True): " eliminated {eliminations} candidate(s)",
+    (False, False): "",
+}
+
+
+def _freeze_grid(board: SudokuBoard) -> Tuple[Tuple[int, ...], ...]:
+    """Snapshot the board values as an immutable 9x9 tuple grid."""
+    return tuple(tuple(cell.get_value() for cell in row) for row in board.grid)
+
+
+def _freeze_candidates(board: SudokuBoard) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Snapshot the board candidates as an immutable 9x9 grid of sorted tuples.
+    The tuples are shared from MASK_DIGITS and serialize to JSON as-is.
+    """
+    return tuple(
+        tuple(MASK_DIGITS[cell.get_mask()] for cell in row) for row in board.grid
+    )
+
 
 class FrontendSudokuSolver:
     """
@@ -48,37 +81,68 @@ class FrontendSudokuSolver:
            b. Constraint elimination step (shows basic eliminations)
            c. Advanced elimination step (if any advanced eliminations)
         """
-        board = SudokuBoard(puzzle)
-        techniques_applied = []
-        solving_steps = []
+        summary = {}
+        # The generator is fully consumed here, so the pooled board is safe to use
+        solving_steps = list(
+            self.iter_steps(puzzle, summary, board=SudokuBoard.pooled(puzzle))
+        )
+
+        return {
+            "solved_grid": summary["solved_grid"],
+            "is_solved": summary["is_solved"],
+            "message": summary["message"],
+            "techniques_applied": summary["techniques_applied"],
+            "iterations": summary["iterations"],
+            "solving_steps": solving_steps,
+            "total_logical_steps": summary["total_logical_steps"],
+        }
+
+    def iter_steps(
+        self,
+        puzzle: List[List[int]],
+        summary: Optional[Dict[str, Any]] = None,
+        board: Optional[SudokuBoard] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily solve a Sudoku puzzle, yielding each solving step as it is produced.
+
+        Only the current board and one step are held at a time. Once the
+        generator is exhausted, `summary` (if given) is filled with the result
+        fields that solve() returns alongside the steps. `board`, if given,
+        must already hold `puzzle`; otherwise a fresh board is built, since a
+        streamed generator may be resumed on different threads.
+        """
+        if board is None:
+            board = SudokuBoard(puzzle)
+        techniques_applied = []  # discovery order, for the API
+        techniques_applied_set = set()
 
         # Initial state
-        initial_grid = [[cell.get_value() for cell in row] for row in board.grid]
-        initial_empty_count = sum(
-            1 for row in initial_grid for cell in row if cell == 0
-        )
+        initial_grid = _freeze_grid(board)
+        initial_empty_count = sum(row.count(0) for row in initial_grid)
 
         # Step 1: Initial constraint propagation
         constraint_changes = board.update_candidates()
 
+        # Immutable board snapshots as of the last mutation, shared by step
+        # dicts and reused until the board changes again
+        last_grid_snapshot = initial_grid
+        last_candidates_snapshot = _freeze_candidates(board)
+
         if constraint_changes:
-            solving_steps.append(
-                {
-                    "step_type": "initial_constraints",
-                    "grid": copy.deepcopy(
-                        [[cell.get_value() for cell in row] for row in board.grid]
-                    ),
-                    "candidates": copy.deepcopy(board.get_candidates_grid()),
-                    "technique": "Initial Setup",
-                    "description": f"Applied basic Sudoku constraints to starting puzzle with {initial_empty_count} empty cells",
-                    "cells_solved": 0,
-                    "candidates_eliminated": len(constraint_changes),
-                    "candidate_changes": self._format_constraint_changes(
-                        constraint_changes
-                    ),
-                    "explanation": "Eliminated candidates that conflict with given numbers in rows, columns, and boxes",
-                }
-            )
+            yield {
+                "step_type": "initial_constraints",
+                "grid": initial_grid,
+                "candidates": last_candidates_snapshot,
+                "technique": "Initial Setup",
+                "description": f"Applied basic Sudoku constraints to starting puzzle with {initial_empty_count} empty cells",
+                "cells_solved": 0,
+                "candidates_eliminated": len(constraint_changes),
+                "candidate_changes": self._format_constraint_changes(
+                    constraint_changes
+                ),
+                "explanation": "Eliminated candidates that conflict with given numbers in rows, columns, and boxes",
+            }
 
         changed = True
         iteration = 0
@@ -88,33 +152,38 @@ class FrontendSudokuSolver:
             changed = False
             iteration += 1
 
-            for technique_name, technique_func in self.techniques:
-                # Save state before technique
-                before_grid = [[cell.get_value() for cell in row] for row in board.grid]
-                before_candidates = board.get_candidates_grid()
-                before_solved_count = sum(
-                    1 for row in before_grid for cell in row if cell != 0
-                )
+            for technique_index, (technique_name, technique_func) in enumerate(
+                self.techniques
+            ):
+                # Nothing changed since this technique last ran to a fixpoint
+                if not board.has_dirty_units(technique_name):
+                    continue
+
+                # State before technique is the cached snapshot; nothing is
+                # materialized unless the technique actually fires
+                before_grid = last_grid_snapshot
+                before_candidates = last_candidates_snapshot
 
                 # Apply technique (this may fill cells and eliminate candidates)
-                technique_applied = technique_func(board)
+                technique_applied, _ = technique_func(board)
+                board.clear_dirty_units(technique_name)
 
                 if technique_applied:
                     changed = True
-                    if technique_name not in techniques_applied:
+                    if technique_name not in techniques_applied_set:
+                        techniques_applied_set.add(technique_name)
                         techniques_applied.append(technique_name)
 
                     # Get state after technique but before constraint propagation
-                    after_technique_grid = [
-                        [cell.get_value() for cell in row] for row in board.grid
-                    ]
-                    after_technique_candidates = board.get_candidates_grid()
-                    after_solved_count = sum(
-                        1 for row in after_technique_grid for cell in row if cell != 0
+                    after_technique_grid = _freeze_grid(board)
+                    after_technique_candidates = _freeze_candidates(board)
+                    cells_solved = sum(row.count(0) for row in before_grid) - sum(
+                        row.count(0) for row in after_technique_grid
                     )
-                    cells_solved = after_solved_count - before_solved_count
+                    last_grid_snapshot = after_technique_grid
+                    last_candidates_snapshot = after_technique_candidates
 
-                    # Find which cells were solved by the technique
+                    # Find which cells were solved by the technique, as "A1=5"
                     solved_positions = []
                     for row in range(9):
                         for col in range(9):
@@ -128,15 +197,18 @@ class FrontendSudokuSolver:
 
                     # Find technique eliminations (candidates eliminated by the technique itself)
                     technique_eliminations = []
+                    changed_positions = []
                     for row in range(9):
                         for col in range(9):
                             if (
                                 before_candidates[row][col]
                                 != after_technique_candidates[row][col]
                             ):
-                                eliminated = (
-                                    before_candidates[row][col]
-                                    - after_technique_candidates[row][col]
+                                changed_positions.append((row, col))
+                                eliminated = tuple(
+                                    d
+                                    for d in before_candidates[row][col]
+                                    if d not in after_technique_candidates[row][col]
                                 )
                                 if (
                                     eliminated and after_technique_grid[row][col] == 0
@@ -157,6 +229,9 @@ class FrontendSudokuSolver:
                                         }
                                     )
 
+                    # Other techniques must rescan the units touched here
+                    board.mark_dirty(changed_positions)
+
                     # STEP A: Technique Step (shows what the technique accomplished)
                     if cells_solved > 0 or technique_eliminations:
                         technique_description = self._create_technique_description(
@@ -166,22 +241,20 @@ class FrontendSudokuSolver:
                             len(technique_eliminations),
                         )
 
-                        solving_steps.append(
-                            {
-                                "step_type": "technique",
-                                "grid": copy.deepcopy(after_technique_grid),
-                                "candidates": copy.deepcopy(after_technique_candidates),
-                                "technique": technique_name,
-                                "description": technique_description,
-                                "cells_solved": cells_solved,
-                                "candidates_eliminated": len(technique_eliminations),
-                                "candidate_changes": technique_eliminations,
-                                "solved_positions": solved_positions,
-                                "explanation": self._get_technique_explanation(
-                                    technique_name
-                                ),
-                            }
-                        )
+                        yield {
+                            "step_type": "technique",
+                            "grid": after_technique_grid,
+                            "candidates": after_technique_candidates,
+                            "technique": technique_name,
+                            "description": technique_description,
+                            "cells_solved": cells_solved,
+                            "candidates_eliminated": len(technique_eliminations),
+                            "candidate_changes": technique_eliminations,
+                            "solved_positions": solved_positions,
+                            "explanation": self._get_technique_explanation(
+                                technique_name
+                            ),
+                        }
 
                     # STEP B: Constraint Elimination Step (if cells were filled)
                     if cells_solved > 0:
@@ -189,92 +262,76 @@ class FrontendSudokuSolver:
                         constraint_changes = board.update_candidates()
 
                         if constraint_changes:
-                            final_grid = [
-                                [cell.get_value() for cell in row] for row in board.grid
-                            ]
-
-                            solving_steps.append(
-                                {
-                                    "step_type": "constraint_elimination",
-                                    "grid": copy.deepcopy(final_grid),
-                                    "candidates": copy.deepcopy(
-                                        board.get_candidates_grid()
-                                    ),
-                                    "technique": "Constraint Propagation",
-                                    "description": f"Eliminated {len(constraint_changes)} candidates due to newly filled cells",
-                                    "cells_solved": 0,
-                                    "candidates_eliminated": len(constraint_changes),
-                                    "candidate_changes": self._format_constraint_changes(
-                                        constraint_changes
-                                    ),
-                                    "solved_positions": solved_positions,  # Reference to cells that caused this
-                                    "explanation": f"Removed candidates that conflict with {', '.join(solved_positions)} in their rows, columns, and boxes",
-                                }
-                            )
+                            # Propagation only removes candidates, so the
+                            # value snapshot from the technique still holds
+                            final_grid = after_technique_grid
+                            final_candidates = _freeze_candidates(board)
+                            solved_summary = ", ".join(solved_positions)
+                            last_grid_snapshot = final_grid
+                            last_candidates_snapshot = final_candidates
+
+                            yield {
+                                "step_type": "constraint_elimination",
+                                "grid": final_grid,
+                                "candidates": final_candidates,
+                                "technique": "Constraint Propagation",
+                                "description": f"Eliminated {len(constraint_changes)} candidates due to newly filled cells",
+                                "cells_solved": 0,
+                                "candidates_eliminated": len(constraint_changes),
+                                "candidate_changes": self._format_constraint_changes(
+                                    constraint_changes
+                                ),
+                                "solved_positions": solved_positions,  # Reference to cells that caused this
+                                "explanation": f"Removed candidates that conflict with {solved_summary} in their rows, columns, and boxes",
+                            }
 
                     step_number += 1
 
+                    # Progress from a costlier technique often unlocks cheaper
+                    # deductions, so restart from the first technique
+                    if technique_index > 0:
+                        break
+
         # Final state
-        solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+        solved_grid = board.export_values()
 
         # Result message
         if board.is_solved():
             message = f"Puzzle solved successfully in {step_number-1} logical steps using {len(techniques_applied)} technique(s)!"
         else:
-            empty_cells = sum(1 for row in solved_grid for cell in row if cell == 0)
+            empty_cells = sum(row.count(0) for row in solved_grid)
             message = f"Partial solution: {empty_cells} cells remaining after {step_number-1} steps using {len(techniques_applied)} technique(s)"
 
-        return {
-            "solved_grid": solved_grid,
-            "is_solved": board.is_solved(),
-            "message": message,
-            "techniques_applied": techniques_applied,
-            "iterations": iteration,
-            "solving_steps": solving_steps,
-            "total_logical_steps": step_number - 1,
-        }
-
-    def _format_constraint_changes(self, constraint_changes: List[Dict]) -> List[Dict]:
-        """Format constraint propagation changes."""
-        formatted = []
-        for change in constraint_changes:
-            formatted.append(
+        if summary is not None:
+            summary.update(
                 {
-                    "position": change["position"],
-                    "location": change["location"],
-                    "eliminated": change["eliminated"],
-                    "old_candidates": change["old_candidates"],
-                    "new_candidates": change["new_candidates"],
+                    "solved_grid": solved_grid,
+                    "is_solved": board.is_solved(),
+                    "message": message,
+                    "techniques_applied": techniques_applied,
+                    "iterations": iteration,
+                    "total_logical_steps": step_number - 1,
                 }
             )
-        return formatted
+
+    def _format_constraint_changes(
+        self, constraint_changes: List[Tuple[int, int, int, int]]
+    ) -> List[Dict]:
+        """Expand constraint propagation change records into step dicts."""
+        return [format_candidate_change(change) for change in constraint_changes]
 
     def _create_technique_description(
         self, step_num: int, technique: str, cells_solved: int, eliminations: int
     ) -> str:
         """Create description for technique step."""
-        desc = f"Step {step_num}: {technique}"
-
-        if cells_solved > 0 and eliminations > 0:
-            desc += f" filled {cells_solved} cell(s) and eliminated {eliminations} candidate(s)"
-        elif cells_solved > 0:
-            desc += f" filled {cells_solved} cell(s)"
-        elif eliminations > 0:
-            desc += f" eliminated {eliminations} candidate(s)"
-
-        return desc
+        suffix = _DESCRIPTION_SUFFIXES[(cells_solved > 0, eliminations > 0)]
+        return f"Step {step_num}: {technique}" + suffix.format(
+            cells=cells_solved, eliminations=eliminations
+        )
 
     def _get_technique_explanation(self, technique_name: str) -> str:
         """Get educational explanation for each technique."""
-        explanations = {
-            "Naked Singles": "When a cell has only one possible candidate remaining, that candidate must be the solution",
-            "Hidden Singles": "When a candidate appears only once within a row, column, or box, it must go in that cell",
-            "Hidden Pairs": "When two candidates appear only in the same two cells within a unit, other candidates can be eliminated from those cells",
-            "Naked Pairs": "When two cells in a unit contain the same two candidates, those candidates can be eliminated from other cells in that unit",
-            "Naked Triples": "When three cells in a unit contain the same three candidates between them, those candidates can be eliminated from other cells in that unit",
-            "Initial Setup": "Basic Sudoku constraints eliminate candidates that would violate row, column, or box rules",
-        }
-        return explanations.get(
+        return _TECHNIQUE_EXPLANATIONS.get(
             technique_name, f"Applied {technique_name} solving technique"
         )
 
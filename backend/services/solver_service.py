@@ -47,15 +47,13 @@ class SudokuSolver:
             - techniques_applied: List of techniques that made progress
             - solving_steps: List of steps with board state and technique applied
         """
-        board = SudokuBoard(puzzle)
+        board = SudokuBoard.pooled(puzzle)
         techniques_applied = []
         solving_steps = []
 
         # Add initial state with more details
-        initial_grid = [[cell.get_value() for cell in row] for row in board.grid]
-        initial_empty_count = sum(
-            1 for row in initial_grid for cell in row if cell == 0
-        )
+        initial_grid = board.export_values()
+        initial_empty_count = sum(row.count(0) for row in initial_grid)
         solving_steps.append(
             {
                 "grid": copy.deepcopy(initial_grid),
@@ -75,13 +73,11 @@ class SudokuSolver:
 
             for technique_name, technique_func in self.techniques:
                 # Save grid state before applying technique
-                before_grid = [[cell.get_value() for cell in row] for row in board.grid]
-                before_solved_count = sum(
-                    1 for row in before_grid for cell in row if cell != 0
-                )
+                before_grid = board.export_values()
+                before_solved_count = 81 - sum(row.count(0) for row in before_grid)
 
                 # Apply technique
-                technique_applied = technique_func(board)
+                technique_applied, _ = technique_func(board)
 
                 if technique_applied:
                     changed = True
@@ -89,12 +85,8 @@ class SudokuSolver:
                         techniques_applied.append(technique_name)
 
                     # Save grid state after applying technique
-                    after_grid = [
-                        [cell.get_value() for cell in row] for row in board.grid
-                    ]
-                    after_solved_count = sum(
-                        1 for row in after_grid for cell in row if cell != 0
-                    )
+                    after_grid = board.export_values()
+                    after_solved_count = 81 - sum(row.count(0) for row in after_grid)
                     cells_solved = after_solved_count - before_solved_count
 
                     # Record this step if it made progress
@@ -111,9 +103,7 @@ class SudokuSolver:
                                         f"R{row+1}C{col+1}={after_grid[row][col]}"
                                     )
 
-                        remaining_empty = sum(
-                            1 for row in after_grid for cell in row if cell == 0
-                        )
+                        remaining_empty = sum(row.count(0) for row in after_grid)
 
                         description = f"Step {step_number}: {technique_name} solved {cells_solved} cell(s)"
                         if solved_positions:
@@ -131,11 +121,11 @@ class SudokuSolver:
                         step_number += 1
 
         # Convert board back to grid format for final state
-        solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+        solved_grid = board.export_values()
 
         # Add final state if different from last step
         if solving_steps and not board.is_solved():
-            final_empty = sum(1 for row in solved_grid for cell in row if cell == 0)
+            final_empty = sum(row.count(0) for row in solved_grid)
             if final_empty > 0:
                 solving_steps.append(
                     {
@@ -150,7 +140,7 @@ class SudokuSolver:
         if board.is_solved():
             message = f"Puzzle solved successfully in {step_number-1} steps using {len(techniques_applied)} technique(s)!"
         else:
-            empty_cells = sum(1 for row in solved_grid for cell in row if cell == 0)
+            empty_cells = sum(row.count(0) for row in solved_grid)
             message = f"Partial solution: {empty_cells} cells remaining after {step_number-1} steps and {len(techniques_applied)} technique(s)"
 
         return {
@@ -4,16 +4,30 @@ Uses the updated technique functions that return TechniqueStep objects.
 """
 
 from typing import Dict, Any, List, Tuple
-import copy
-from board.board import SudokuBoard
+from board.cell import MASK_DIGITS
+from board.board import (
+    SudokuBoard,
+    snapshot_to_candidates,
+    snapshot_to_grid,
+)
 from logic.naked_single import apply_one_naked_single
 from logic.hidden_single import apply_one_hidden_single
+from logic.singles import apply_one_single
 from logic.hidden_pairs import apply_one_hidden_pair
 from logic.naked_pairs import apply_one_naked_pair
 from logic.naked_triples import apply_one_naked_triple
 from helpers.get_location import get_cell_location
 from config.settings import settings
 
+# Educational explanation shown for each technique
+_TECHNIQUE_EXPLANATIONS = {
+    "Naked Single": "When a cell has only one possible candidate remaining, that candidate must be the solution",
+    "Hidden Single": "When a candidate appears only once within a row, column, or box, it must go in that cell",
+    "Hidden Pair": "When two candidates appear only in the same two cells within a unit, other candidates can be eliminated from those cells",
+    "Naked Pair": "When two cells in a unit contain the same two candidates, those candidates can be eliminated from other cells in that unit",
+    "Naked Triple": "When three cells in a unit contain the same three candidates between them, those candidates can be eliminated from other cells in that unit",
+}
+
 
 class StepByStepSolver:
     """
@@ -35,6 +49,13 @@ class StepByStepSolver:
             ("Hidden Pair", apply_one_hidden_pair),
             ("Naked Triple", apply_one_naked_triple),
         ]
+        # What solve() runs: both singles come from one fused unit sweep,
+        # which finds the same cell as running them back to back
+        self.technique_passes = [apply_one_single] + [
+            func
+            for _, func in self.techniques
+            if func not in (apply_one_naked_single, apply_one_hidden_single)
+        ]
 
     def solve(self, puzzle: List[List[int]]) -> Dict[str, Any]:
         """
@@ -43,15 +64,16 @@ class StepByStepSolver:
         Returns:
             Dictionary with solved grid, steps, and metadata
         """
-        board = SudokuBoard(puzzle)
-        techniques_applied = []
+        board = SudokuBoard.pooled(puzzle)
+        techniques_applied = []  # discovery order, for the API
+        techniques_applied_set = set()
         solving_steps = []
+        # Candidate rows shared between steps whose rows are unchanged
+        candidate_rows = {}
 
         # Initial state
-        initial_grid = [[cell.get_value() for cell in row] for row in board.grid]
-        initial_empty_count = sum(
-            1 for row in initial_grid for cell in row if cell == 0
-        )
+        initial_grid = board.export_values()
+        initial_empty_count = sum(row.count(0) for row in initial_grid)
 
         # Step 1: Initial constraint propagation
         constraint_changes = board.update_candidates()
@@ -62,26 +84,30 @@ class StepByStepSolver:
                     constraint_changes,
                     board,
                     f"Applied basic Sudoku constraints to starting puzzle with {initial_empty_count} empty cells",
+                    grid=initial_grid,
+                    candidate_rows=candidate_rows,
                 )
             )
 
+        # Cell values as of the last technique application; techniques that
+        # don't apply leave them untouched, so no per-attempt snapshot is needed
+        last_vals = bytes(val for row in initial_grid for val in row)
+
         # Main solving loop
         changed = True
         iteration = 0
         step_number = 1
 
-        while changed and iteration < self.MAX_ITERATIONS and not board.is_solved():
+        # A full grid ends the search; checked on the cached values rather
+        # than re-walking the board with is_solved() before every attempt
+        while changed and iteration < self.MAX_ITERATIONS and 0 in last_vals:
             changed = False
             iteration += 1
 
             # Try each technique once per iteration
-            for technique_name, technique_func in self.techniques:
-                if board.is_solved():
-                    break
-
-                # Save state before technique
-                before_grid = [[cell.get_value() for cell in row] for row in board.grid]
-                before_candidates = board.get_candidates_grid()
+            for technique_func in self.technique_passes:
+                # State before technique
+                before_vals = last_vals
 
                 # Apply single technique
                 technique_applied, technique_step = technique_func(board)
@@ -89,45 +115,38 @@ class StepByStepSolver:
                 if technique_applied and technique_step:
                     changed = True
                     step_number += 1
+                    technique_name = technique_step.technique
 
-                    if technique_name not in techniques_applied:
+                    if technique_name not in techniques_applied_set:
+                        techniques_applied_set.add(technique_name)
                         techniques_applied.append(technique_name)
 
                     # Get state after technique
-                    after_grid = [
-                        [cell.get_value() for cell in row] for row in board.grid
-                    ]
-                    after_candidates = board.get_candidates_grid()
-
-                    # Count cells solved
-                    cells_solved = sum(
-                        1
-                        for r in range(9)
-                        for c in range(9)
-                        if before_grid[r][c] == 0 and after_grid[r][c] != 0
-                    )
+                    after_vals, after_cands = board.snapshot()
+                    last_vals = after_vals
 
                     # Find solved positions
-                    solved_positions = []
-                    for r in range(9):
-                        for c in range(9):
-                            if before_grid[r][c] == 0 and after_grid[r][c] != 0:
-                                solved_positions.append(
-                                    f"{get_cell_location(r, c)}={after_grid[r][c]}"
-                                )
+                    solved_positions = [
+                        f"{get_cell_location(*divmod(i, 9))}={after_vals[i]}"
+                        for i in range(81)
+                        if before_vals[i] == 0 and after_vals[i] != 0
+                    ]
+                    cells_solved = len(solved_positions)
+                    after_grid = snapshot_to_grid(after_vals)
 
                     # Count candidate eliminations
-                    eliminations_count = 0
-                    for elimination in technique_step.eliminations:
-                        for positions in elimination.values():
-                            eliminations_count += len(positions)
+                    eliminations_count = sum(
+                        map(len, technique_step.eliminations.values())
+                    )
 
                     # Create solving step from TechniqueStep
                     solving_step = {
                         "step_type": "technique",
                         "step_number": step_number,
-                        "grid": copy.deepcopy(after_grid),
-                        "candidates": copy.deepcopy(after_candidates),
+                        "grid": after_grid,
+                        "candidates": snapshot_to_candidates(
+                            after_cands, candidate_rows
+                        ),
                         "technique": technique_step.technique,
                         "description": f"Step {step_number}: {technique_step.description}",
                         "cells_solved": cells_solved,
@@ -153,6 +172,8 @@ class StepByStepSolver:
                                 board,
                                 f"Eliminated {len(constraint_changes)} candidates due to newly filled cells",
                                 solved_positions,
+                                grid=after_grid,
+                                candidate_rows=candidate_rows,
                             )
                             solving_steps.append(constraint_step)
 
@@ -160,13 +181,13 @@ class StepByStepSolver:
                     break
 
         # Final state
-        solved_grid = [[cell.get_value() for cell in row] for row in board.grid]
+        solved_grid = board.export_values()
 
         # Result message
         if board.is_solved():
             message = f"Puzzle solved successfully in {len(solving_steps)} steps using {len(techniques_applied)} technique(s)!"
         else:
-            empty_cells = sum(1 for row in solved_grid for cell in row if cell == 0)
+            empty_cells = sum(row.count(0) for row in solved_grid)
             message = f"Partial solution: {empty_cells} cells remaining after {len(solving_steps)} steps using {len(techniques_applied)} technique(s)"
 
         return {
@@ -181,18 +202,26 @@ class StepByStepSolver:
 
     def _create_constraint_step(
         self,
-        constraint_changes: List[Dict],
+        constraint_changes: List[Tuple[int, int, int, int]],
         board: SudokuBoard,
         description: str,
         solved_positions: List[str] = None,
+        grid: List[List[int]] = None,
+        candidate_rows: Dict = None,
     ) -> Dict:
-        """Create a constraint propagation step."""
+        """
+        Create a constraint propagation step.
+
+        Constraint propagation never fills cells, so a caller that already
+        holds the current value grid can pass it as `grid` to reuse it.
+        `candidate_rows` is the solve's shared candidate row cache.
+        """
         return {
             "step_type": "constraint_elimination",
-            "grid": copy.deepcopy(
-                [[cell.get_value() for cell in row] for row in board.grid]
+            "grid": grid if grid is not None else board.export_values(),
+            "candidates": snapshot_to_candidates(
+                board.get_candidates_bitmask(), candidate_rows
             ),
-            "candidates": copy.deepcopy(board.get_candidates_grid()),
             "technique": "Constraint Propagation",
             "description": description,
             "cells_solved": 0,
@@ -202,48 +231,45 @@ class StepByStepSolver:
             "explanation": "Removed candidates that conflict with filled cells in their rows, columns, and boxes",
         }
 
-    def _format_eliminations(self, eliminations: List[Dict]) -> List[Dict]:
+    def _format_eliminations(
+        self, eliminations: Dict[int, List[Tuple[int, int]]]
+    ) -> List[Dict]:
         """Format eliminations from TechniqueStep into API format."""
         formatted = []
-        for elimination in eliminations:
-            for candidate, positions in elimination.items():
-                for pos in positions:
-                    formatted.append(
-                        {
-                            "position": pos,
-                            "location": get_cell_location(pos[0], pos[1]),
-                            "eliminated": [int(candidate)],
-                            "old_candidates": [],  # Would need to track this separately
-                            "new_candidates": [],  # Would need to track this separately
-                        }
-                    )
+        for candidate, positions in eliminations.items():
+            for pos in positions:
+                formatted.append(
+                    {
+                        "position": pos,
+                        "location": get_cell_location(pos[0], pos[1]),
+                        "eliminated": [candidate],
+                        "old_candidates": [],  # Would need to track this separately
+                        "new_candidates": [],  # Would need to track this separately
+                    }
+                )
         return formatted
 
-    def _format_constraint_changes(self, constraint_changes: List[Dict]) -> List[Dict]:
-        """Format constraint propagation changes."""
+    def _format_constraint_changes(
+        self, constraint_changes: List[Tuple[int, int, int, int]]
+    ) -> List[Dict]:
+        """Expand constraint propagation change records into API format."""
         formatted = []
-        for change in constraint_changes:
+        for cell_idx, eliminated, old, new in constraint_changes:
+            r, c = divmod(cell_idx, 9)
             formatted.append(
                 {
-                    "position": change["position"],
-                    "location": change["location"],
-                    "eliminated": list(change["eliminated"]),
-                    "old_candidates": list(change["old_candidates"]),
-                    "new_candidates": list(change["new_candidates"]),
+                    "position": (r, c),
+                    "location": get_cell_location(r, c),
+                    "eliminated": list(MASK_DIGITS[eliminated]),
+                    "old_candidates": list(MASK_DIGITS[old]),
+                    "new_candidates": list(MASK_DIGITS[new]),
                 }
             )
         return formatted
 
     def _get_technique_explanation(self, technique_name: str) -> str:
         """Get educational explanation for each technique."""
-        explanations = {
-            "Naked Single": "When a cell has only one possible candidate remaining, that candidate must be the solution",
-            "Hidden Single": "When a candidate appears only once within a row, column, or box, it must go in that cell",
-            "Hidden Pair": "When two candidates appear only in the same two cells within a unit, other candidates can be eliminated from those cells",
-            "Naked Pair": "When two cells in a unit contain the same two candidates, those candidates can be eliminated from other cells in that unit",
-            "Naked Triple": "When three cells in a unit contain the same three candidates between them, those candidates can be eliminated from other cells in that unit",
-        }
-        return explanations.get(
+        return _TECHNIQUE_EXPLANATIONS.get(
             technique_name, f"Applied {technique_name} solving technique"
         )
 
@@ -5,6 +5,13 @@ Handles format validation, solvability checks, and uniqueness validation.
 
 from typing import List
 
+from board.board import CELL_UNIT_IDS, PEERS, unit_used_masks
+from board.cell import ALL_CANDIDATES_MASK, MASK_POPCOUNT
+from helpers.check_solvable import check_solvable
+
+# Values allowed in a puzzle cell (0 = empty)
+VALID_VALUES = frozenset(range(10))
+
 
 def is_valid_format(puzzle: List[List[int]]) -> bool:
     """
@@ -18,60 +25,93 @@ def is_valid_format(puzzle: List[List[int]]) -> bool:
     """
     if len(puzzle) != 9:
         return False
-    for row in puzzle:
-        if len(row) != 9:
-            return False
-        for val in row:
-            if not (0 <= val <= 9):
-                return False
-    return True
+    return all(len(row) == 9 and VALID_VALUES.issuperset(row) for row in puzzle)
 
 
-def get_candidates(board: List[List[int]], row: int, col: int) -> List[int]:
+def _select_cell(board: bytearray, unit_mask: List[int]) -> tuple:
     """
-    Get valid candidate numbers for a cell.
-
-    Args:
-        board: 9x9 Sudoku grid
-        row: Row index (0-8)
-        col: Column index (0-8)
+    Pick the empty cell with the fewest candidates (most constrained first).
 
     Returns:
-        List of valid numbers (1-9) for the cell
+        Tuple (index, candidate_mask), or None if board is complete
     """
-    used = set()
-
-    # Check row
-    used.update(board[row])
-
-    # Check column
-    used.update(board[r][col] for r in range(9))
-
-    # Check 3x3 box
-    start_row = (row // 3) * 3
-    start_col = (col // 3) * 3
-    for r in range(start_row, start_row + 3):
-        for c in range(start_col, start_col + 3):
-            used.add(board[r][c])
-
-    return [n for n in range(1, 10) if n not in used]
-
+    best = None
+    best_count = 10
+    for idx, (row, col, box) in enumerate(CELL_UNIT_IDS):
+        if board[idx]:
+            continue
+        cand = ~(unit_mask[row] | unit_mask[col] | unit_mask[box]) & ALL_CANDIDATES_MASK
+        count = MASK_POPCOUNT[cand]
+        if count < best_count:
+            best, best_count = (idx, cand), count
+            if count <= 1:
+                break  # Forced or dead-end cell, can't do better
+    return best
+
+
+def _count_solutions_masked(
+    board: bytearray, unit_mask: List[int], max_solutions: int
+) -> int:
+    """
+    Backtracking solution counter over a flat 81-byte board.
 
-def find_empty_cell(board: List[List[int]]) -> tuple:
+    unit_mask holds the digits already used in each of the 27 units as bitmasks
+    (bit d set for digit d), indexed by CELL_UNIT_IDS. It and the board are
+    scratch state: the search runs on an explicit stack rather than recursion,
+    and returns as soon as max_solutions is reached without restoring them.
     """
-    Find the first empty cell in the board.
+    cell = _select_cell(board, unit_mask)
+    if not cell:
+        return 1  # Found a complete solution
 
-    Args:
-        board: 9x9 Sudoku grid
+    solution_count = 0
+    # Each frame is [cell index, untried candidate mask, digit bit placed there]
+    stack = [[cell[0], cell[1], 0]]
+
+    while stack:
+        frame = stack[-1]
+        idx, mask, bit = frame
+        row, col, box = CELL_UNIT_IDS[idx]
+
+        # backtrack the digit tried here last time
+        if bit:
+            board[idx] = 0
+            unit_mask[row] ^= bit
+            unit_mask[col] ^= bit
+            unit_mask[box] ^= bit
+
+        if not mask:
+            stack.pop()
+            continue
+
+        bit = mask & -mask
+        frame[1] = mask ^ bit
+        frame[2] = bit
+        board[idx] = bit.bit_length() - 1
+        unit_mask[row] |= bit
+        unit_mask[col] |= bit
+        unit_mask[box] |= bit
+
+        # Forward check: skip the digit if it leaves an empty peer with no candidates
+        for peer in PEERS[idx]:
+            if not board[peer]:
+                r, c, b = CELL_UNIT_IDS[peer]
+                if (
+                    not ~(unit_mask[r] | unit_mask[c] | unit_mask[b])
+                    & ALL_CANDIDATES_MASK
+                ):
+                    break
+        else:
+            cell = _select_cell(board, unit_mask)
+            if cell:
+                stack.append([cell[0], cell[1], 0])
+            else:
+                solution_count += 1  # Found a complete solution
+                # Early exit if we find more than one solution
+                if solution_count >= max_solutions:
+                    return solution_count
 
-    Returns:
-        Tuple (row, col) of empty cell, or None if board is complete
-    """
-    for r in range(9):
-        for c in range(9):
-            if board[r][c] == 0:
-                return (r, c)
-    return None
+    return solution_count
 
 
 def count_solutions(board: List[List[int]], max_solutions: int = 2) -> int:
@@ -79,29 +119,17 @@ def count_solutions(board: List[List[int]], max_solutions: int = 2) -> int:
     Count the number of solutions for a puzzle (up to max_solutions).
 
     Args:
-        board: 9x9 Sudoku grid (will be modified during search)
+        board: 9x9 Sudoku grid (not modified)
         max_solutions: Maximum solutions to count (for efficiency)
 
     Returns:
         Number of solutions found (capped at max_solutions)
     """
-    cell = find_empty_cell(board)
-    if not cell:
-        return 1  # Found a complete solution
+    flat = bytearray(val for row in board for val in row)
+    # Empty cells set bit 0, which ALL_CANDIDATES_MASK strips from every lookup
+    unit_mask = unit_used_masks(flat)
 
-    row, col = cell
-    solution_count = 0
-
-    for num in get_candidates(board, row, col):
-        board[row][col] = num
-        solution_count += count_solutions(board, max_solutions)
-        board[row][col] = 0  # backtrack
-
-        # Early exit if we find more than one solution
-        if solution_count >= max_solutions:
-            return solution_count
-
-    return solution_count
+    return _count_solutions_masked(flat, unit_mask, max_solutions)
 
 
 def has_unique_solution(puzzle: List[List[int]]) -> bool:
@@ -114,9 +142,8 @@ def has_unique_solution(puzzle: List[List[int]]) -> bool:
     Returns:
         bool: True if puzzle has exactly one solution
     """
-    # Create a copy to avoid modifying the original
-    board_copy = [row[:] for row in puzzle]
-    solution_count = count_solutions(board_copy, max_solutions=2)
+    # count_solutions searches on its own flat copy, leaving puzzle untouched
+    solution_count = count_solutions(puzzle, max_solutions=2)
 
     return solution_count == 1
 
@@ -131,6 +158,4 @@ def is_solvable(puzzle: List[List[int]]) -> bool:
     Returns:
         bool: True if puzzle is solvable
     """
-    from helpers.check_solvable import check_solvable
-
     return check_solvable(puzzle)
@@ -1,3 +1,5 @@
+import sys
+
 from helpers.print_board import print_input_puzzle
 from helpers.read_puzzle import read_puzzle
 from helpers.check_solvable import check_solvable
@@ -10,7 +12,7 @@ from logic.naked_pairs import apply_all_naked_pairs  # <-- Import naked pairs he
 from board.board import SudokuBoard
 
 
-def main():
+def main(verbose=False):
     puzzle = read_puzzle("test_puzzles/puzzle_hidden_pairs.txt")
     print("Initial Puzzle:")
     print_input_puzzle(puzzle)
@@ -42,36 +44,40 @@ def main():
     while True:
         any_changed = False
 
-        changed = apply_all_naked_pairs(board)  # <-- Apply naked pairs here
+        changed, _ = apply_all_naked_pairs(board)  # <-- Apply naked pairs here
         if changed:
-            print("\nBoard after applying naked pairs:")
-            board.display_simple()
             any_changed = True
-        else:
+            if verbose:
+                print("\nBoard after applying naked pairs:")
+                board.display_simple()
+        elif verbose:
             print("No naked pairs found.")
 
-        changed = apply_all_naked_singles(board)
+        changed, _ = apply_all_naked_singles(board)
         if changed:
-            print("\nBoard after applying all naked singles:")
-            board.display_simple()
             any_changed = True
-        else:
+            if verbose:
+                print("\nBoard after applying all naked singles:")
+                board.display_simple()
+        elif verbose:
             print("No naked singles found on this board.")
 
-        changed = apply_all_hidden_singles(board)
+        changed, _ = apply_all_hidden_singles(board)
         if changed:
-            print("\nBoard after applying hidden singles:")
-            board.display_simple()
             any_changed = True
-        else:
+            if verbose:
+                print("\nBoard after applying hidden singles:")
+                board.display_simple()
+        elif verbose:
             print("No hidden singles found.")
 
-        changed = apply_all_hidden_pairs(board)
+        changed, _ = apply_all_hidden_pairs(board)
         if changed:
-            print("\nBoard after applying hidden pairs:")
-            board.display_simple()
             any_changed = True
-        else:
+            if verbose:
+                print("\nBoard after applying hidden pairs:")
+                board.display_simple()
+        elif verbose:
             print("No hidden pairs found.")
 
         if board.is_solved():
@@ -87,4 +93,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Pass -v to print the board after every technique
+    main(verbose="-v" in sys.argv[1:])
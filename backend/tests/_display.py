@@ -0,0 +1,91 @@
+"""
+Output helpers shared by the test modules.
+"""
+
+import os
+
+from helpers.get_location import get_cell_location
+
+# Detailed output is only printed when SUDOKU_VERBOSE=1, so the tests time the solver
+VERBOSE = os.environ.get("SUDOKU_VERBOSE", "0") == "1"
+
+# Render empty cells (0) as dots
+BLANK_AS_DOT = str.maketrans("0", ".")
+
+
+def print_grid(grid, title="Grid"):
+    """Print a Sudoku grid with title."""
+    if not VERBOSE:
+        return
+    border = "+-------+-------+-------+"
+    lines = [f"\n{title}:", border]
+    for i, row in enumerate(grid):
+        cells = "".join(map(str, row)).translate(BLANK_AS_DOT)
+        lines.append(
+            f"| {' '.join(cells[:3])} | {' '.join(cells[3:6])} | {' '.join(cells[6:])} |"
+        )
+        if i % 3 == 2 and i < 8:
+            lines.append(border)
+    lines.append(border)
+    # One write for the whole grid rather than one print per cell
+    print("\n".join(lines))
+
+
+def print_step_details(step, step_index):
+    """Print detailed information about a solving step."""
+    if not VERBOSE:
+        return
+    step_type = step.get("step_type", "unknown")
+
+    # Different formatting based on step type
+    if step_type == "constraint_elimination":
+        print(f"\n{'─'*60}")
+        print(f"⚙️  CONSTRAINT PROPAGATION")
+        print(f"{'─'*60}")
+        print(f"📋 {step['description']}")
+        print(f"💡 {step['explanation']}")
+
+        if step.get("candidate_changes"):
+            print(f"🔍 Constraint eliminations: {len(step['candidate_changes'])}")
+            # Group eliminations by affected cells
+            affected_cells = set()
+            for change in step["candidate_changes"]:
+                affected_cells.add(change["location"])
+
+            print(f"   Affected cells: {', '.join(sorted(affected_cells)[:8])}")
+            if len(affected_cells) > 8:
+                print(f"   ... and {len(affected_cells)-8} more cells")
+
+    else:  # technique step
+        print(f"\n{'='*60}")
+        print(f"🧠 {step.get('technique', 'UNKNOWN').upper()}")
+        if step.get("step_number"):
+            print(f"Step #{step['step_number']}")
+        print(f"{'='*60}")
+        print(f"📋 {step['description']}")
+        if step.get("explanation"):
+            print(f"💡 {step['explanation']}")
+
+        if step.get("cells_solved", 0) > 0:
+            print(f"✅ Cells filled: {', '.join(step.get('solved_positions', []))}")
+
+        if step.get("focus_cells"):
+            focus_locations = [get_cell_location(r, c) for r, c in step["focus_cells"]]
+            print(f"🎯 Focus cells: {', '.join(focus_locations)}")
+
+        if step.get("value"):
+            print(f"🔢 Value placed: {step['value']}")
+
+        if step.get("candidate_changes"):
+            print(f"🔍 Candidate eliminations: {len(step['candidate_changes'])}")
+            for change in step["candidate_changes"][:3]:  # Show first 3
+                eliminated = change.get("eliminated", [])
+                print(f"   {change['location']}: removed {eliminated}")
+            if len(step["candidate_changes"]) > 3:
+                print(
+                    f"   ... and {len(step['candidate_changes'])-3} more eliminations"
+                )
+
+    # Show progress
+    remaining = sum(1 for row in step["grid"] for cell in row if cell == 0)
+    print(f"📊 Progress: {remaining} cells remaining")
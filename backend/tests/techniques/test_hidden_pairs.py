@@ -54,8 +54,8 @@ def test_hidden_pairs_elimination():
 
     # Before applying technique
     print("Before hidden pairs:")
-    print(f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}")
-    print(f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}")
+    print(f"R1C1 candidates: {list(board.grid[0][0].sorted_candidates)}")
+    print(f"R1C2 candidates: {list(board.grid[0][1].sorted_candidates)}")
 
     # Apply hidden pairs technique
     changed, step = apply_one_hidden_pair(board)
@@ -66,8 +66,8 @@ def test_hidden_pairs_elimination():
 
     # After applying technique
     print("\nAfter hidden pairs:")
-    print(f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}")
-    print(f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}")
+    print(f"R1C1 candidates: {list(board.grid[0][0].sorted_candidates)}")
+    print(f"R1C2 candidates: {list(board.grid[0][1].sorted_candidates)}")
 
     # Both cells should now only have candidates {4, 8} (the hidden pair)
     assert board.grid[0][0].get_candidates() == {
@@ -56,6 +56,6 @@ def test_naked_pairs_row_elimination():
 
     # Optionally, verify the step records the correct focus cells and eliminations
     assert set(step.focus_cells) == {(0, 0), (0, 1)}
-    elim_map = {k: set(v) for d in step.eliminations for k, v in d.items()}
+    elim_map = {str(k): set(v) for k, v in step.eliminations.items()}
     assert elim_map["1"] == {(0, 2)}
     assert elim_map["2"] == {(0, 2), (0, 3)}
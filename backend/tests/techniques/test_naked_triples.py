@@ -11,35 +11,13 @@ def make_board_with_naked_triples():
     """
     Create a board with a naked triple scenario.
 
-    In this setup, cells R1C1, R1C2, R1C3 contain candidates that form a naked triple.
+    In this setup, cells R1C1, R2C1, R3C1 contain candidates that form a naked triple.
     For example: {1,2}, {2,3}, {1,3} - together they contain exactly {1,2,3}
     """
     # Start with empty grid
     grid = [[0 for _ in range(9)] for _ in range(9)]
     board = SudokuBoard(grid)
 
-    # Fill some cells to create constraints
-    board.grid[0][3].set_value(4)  # R1C4 = 4
-    board.grid[0][4].set_value(5)  # R1C5 = 5
-    board.grid[0][5].set_value(6)  # R1C6 = 6
-    board.grid[0][6].set_value(7)  # R1C7 = 7
-    board.grid[0][7].set_value(8)  # R1C8 = 8
-    board.grid[0][8].set_value(9)  # R1C9 = 9
-
-    # Set up naked triple scenario in first row
-    # These three cells together contain exactly candidates {1, 2, 3}
-    board.grid[0][0].set_candidates({1, 2})  # R1C1: {1, 2}
-    board.grid[0][1].set_candidates({2, 3})  # R1C2: {2, 3}
-    board.grid[0][2].set_candidates({1, 3})  # R1C3: {1, 3}
-
-    # Other cells in the row that should have candidates eliminated
-    # These cells currently have some of {1, 2, 3} which should be removed
-    # (Note: positions 3-8 are already filled, so we can't test elimination there)
-
-    # Let's create a column scenario instead for better testing
-    # Reset and create column-based naked triple
-    board = SudokuBoard(grid)
-
     # Fill some cells in first column to create constraints
     board.grid[3][0].set_value(4)  # R4C1 = 4
     board.grid[4][0].set_value(5)  # R5C1 = 5
@@ -88,14 +66,14 @@ def test_naked_triples_elimination():
 
     # Before applying technique
     print("Before naked triples:")
-    print(f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}")  # {1, 2}
-    print(f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}")  # {2, 3}
-    print(f"R1C3 candidates: {sorted(board.grid[0][2].get_candidates())}")  # {1, 3}
-    print(f"R1C4 candidates: {sorted(board.grid[0][3].get_candidates())}")  # {1, 4, 5}
-    print(f"R1C5 candidates: {sorted(board.grid[0][4].get_candidates())}")  # {2, 6, 7}
-    print(f"R1C6 candidates: {sorted(board.grid[0][5].get_candidates())}")  # {3, 8, 9}
+    print(f"R1C1 candidates: {list(board.grid[0][0].sorted_candidates)}")  # {1, 2}
+    print(f"R1C2 candidates: {list(board.grid[0][1].sorted_candidates)}")  # {2, 3}
+    print(f"R1C3 candidates: {list(board.grid[0][2].sorted_candidates)}")  # {1, 3}
+    print(f"R1C4 candidates: {list(board.grid[0][3].sorted_candidates)}")  # {1, 4, 5}
+    print(f"R1C5 candidates: {list(board.grid[0][4].sorted_candidates)}")  # {2, 6, 7}
+    print(f"R1C6 candidates: {list(board.grid[0][5].sorted_candidates)}")  # {3, 8, 9}
     print(
-        f"R1C7 candidates: {sorted(board.grid[0][6].get_candidates())}"
+        f"R1C7 candidates: {list(board.grid[0][6].sorted_candidates)}"
     )  # {1, 2, 3, 4}
 
     # Apply naked triples technique
@@ -108,25 +86,25 @@ def test_naked_triples_elimination():
     # After applying technique
     print("\nAfter naked triples:")
     print(
-        f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}"
+        f"R1C1 candidates: {list(board.grid[0][0].sorted_candidates)}"
     )  # Should remain {1, 2}
     print(
-        f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}"
+        f"R1C2 candidates: {list(board.grid[0][1].sorted_candidates)}"
     )  # Should remain {2, 3}
     print(
-        f"R1C3 candidates: {sorted(board.grid[0][2].get_candidates())}"
+        f"R1C3 candidates: {list(board.grid[0][2].sorted_candidates)}"
     )  # Should remain {1, 3}
     print(
-        f"R1C4 candidates: {sorted(board.grid[0][3].get_candidates())}"
+        f"R1C4 candidates: {list(board.grid[0][3].sorted_candidates)}"
     )  # Should become {4, 5}
     print(
-        f"R1C5 candidates: {sorted(board.grid[0][4].get_candidates())}"
+        f"R1C5 candidates: {list(board.grid[0][4].sorted_candidates)}"
     )  # Should become {6, 7}
     print(
-        f"R1C6 candidates: {sorted(board.grid[0][5].get_candidates())}"
+        f"R1C6 candidates: {list(board.grid[0][5].sorted_candidates)}"
     )  # Should become {8, 9}
     print(
-        f"R1C7 candidates: {sorted(board.grid[0][6].get_candidates())}"
+        f"R1C7 candidates: {list(board.grid[0][6].sorted_candidates)}"
     )  # Should become {4}
 
     # Verify eliminations
@@ -0,0 +1,36 @@
+from logic.singles import apply_one_single
+from logic.naked_single import apply_one_naked_single
+from logic.hidden_single import apply_one_hidden_single
+from tests.techniques.test_naked_single import make_board_with_naked_single
+from tests.techniques.test_hidden_single import make_board_with_hidden_single_puzzle
+
+
+def apply_naked_then_hidden(board):
+    changed, step = apply_one_naked_single(board)
+    if changed:
+        return changed, step
+    return apply_one_hidden_single(board)
+
+
+def test_single_prefers_naked_single():
+    board = make_board_with_naked_single()
+    changed, step = apply_one_single(board)
+
+    assert changed
+    assert step.technique == "Naked Single"
+    assert step.focus_cells == [(0, 0)]
+    assert board.grid[0][0].get_value() == 1
+
+
+def test_single_matches_naked_then_hidden():
+    # Walk the hidden single puzzle to a fixpoint both ways, step by step
+    fused = make_board_with_hidden_single_puzzle()
+    sequential = make_board_with_hidden_single_puzzle()
+    while True:
+        changed, step = apply_one_single(fused)
+        expected_changed, expected_step = apply_naked_then_hidden(sequential)
+        assert changed == expected_changed
+        if not changed:
+            break
+        assert step.to_dict() == expected_step.to_dict()
+    assert fused.export_values() == sequential.export_values()
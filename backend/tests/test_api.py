@@ -0,0 +1,80 @@
+"""
+Test the API endpoints in-process, without a running server.
+TestClient needs httpx, installed with requirements-dev.txt.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+
+PUZZLE = (
+    (0, 0, 0, 0, 3, 0, 0, 0, 8),
+    (0, 4, 2, 0, 0, 0, 6, 0, 0),
+    (6, 0, 9, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 5, 7, 0, 0, 4),
+    (3, 0, 0, 0, 0, 0, 0, 0, 7),
+    (2, 0, 0, 9, 4, 0, 0, 6, 0),
+    (0, 0, 5, 0, 0, 3, 2, 0, 1),
+    (0, 0, 1, 0, 0, 0, 0, 7, 0),
+    (0, 0, 0, 0, 2, 0, 0, 0, 0),
+)
+
+# One client for the module, so requests share its transport
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def solve_response():
+    """The /solve response for PUZZLE, shared by the tests that only read it."""
+    return client.post("/solve", json={"puzzle": PUZZLE})
+
+
+def test_solve(solve_response):
+    assert solve_response.status_code == 200
+    result = solve_response.json()
+    assert result["is_solved"] is True
+    assert all(0 not in row for row in result["solved_grid"])
+
+
+def test_solve_compact_matches_solve(solve_response):
+    compact = "".join(str(v) for row in PUZZLE for v in row).replace("0", ".")
+
+    response = client.post("/solve/compact", json={"puzzle": compact})
+
+    assert response.status_code == 200
+    assert response.json() == solve_response.json()
+
+
+def test_solve_compact_rejects_bad_string():
+    response = client.post("/solve/compact", json={"puzzle": "123"})
+
+    assert response.status_code == 400
+
+
+def test_solve_stream(solve_response):
+    response = client.post("/solve-stream", json={"puzzle": PUZZLE})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    # One JSON object per line: the steps, then the summary
+    *steps, summary = [json.loads(line) for line in response.text.splitlines()]
+    assert steps
+    assert all("technique" in step for step in steps)
+    # solved_positions use the same "A1=5" strings as /solve
+    positions = [p for step in steps for p in step.get("solved_positions") or []]
+    assert positions and all(isinstance(p, str) and "=" in p for p in positions)
+    assert summary["is_solved"] is True
+    assert summary["solved_grid"] == solve_response.json()["solved_grid"]
+
+
+def test_solve_stream_rejects_like_solve():
+    empty = [[0] * 9 for _ in range(9)]  # every grid is a solution
+
+    solve = client.post("/solve", json={"puzzle": empty})
+    stream = client.post("/solve-stream", json={"puzzle": empty})
+
+    assert solve.status_code == stream.status_code == 422
+    assert stream.json() == solve.json()
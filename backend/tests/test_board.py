@@ -0,0 +1,42 @@
+import random
+
+from board.board import SudokuBoard
+
+PUZZLE = [
+    [0, 0, 0, 0, 3, 0, 0, 0, 8],
+    [0, 4, 2, 0, 0, 0, 6, 0, 0],
+    [6, 0, 9, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 5, 7, 0, 0, 4],
+    [3, 0, 0, 0, 0, 0, 0, 0, 7],
+    [2, 0, 0, 9, 4, 0, 0, 6, 0],
+    [0, 0, 5, 0, 0, 3, 2, 0, 1],
+    [0, 0, 1, 0, 0, 0, 0, 7, 0],
+    [0, 0, 0, 0, 2, 0, 0, 0, 0],
+]
+
+
+def full_pass(board):
+    # A fresh board holding the same values and candidates, updated in full
+    fresh = SudokuBoard(board.export_values())
+    for cell, other in zip(fresh.cells, board.cells):
+        cell.set_mask(other.get_mask())
+    changes = fresh.update_candidates()
+    return changes, fresh.get_candidates_grid()
+
+
+def test_incremental_update_matches_full_pass():
+    rng = random.Random(0)
+    board = SudokuBoard(PUZZLE)
+    board.update_candidates()
+    for _ in range(20):
+        empty = [cell for cell in board.cells if not cell.is_solved()]
+        # Fill a cell without touching its peers, and widen another cell
+        cell = rng.choice(empty)
+        candidates = cell.get_candidates()
+        if candidates:
+            cell.set_value(rng.choice(sorted(candidates)))
+        rng.choice(empty).set_candidates(set(range(1, 10)))
+
+        expected_changes, expected_candidates = full_pass(board)
+        assert board.update_candidates() == expected_changes
+        assert board.get_candidates_grid() == expected_candidates
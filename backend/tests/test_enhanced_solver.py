@@ -0,0 +1,45 @@
+"""
+Test the enhanced solver's cached entry point.
+"""
+
+import copy
+
+from services.enhanced_solver import _solve_cached, enhanced_solver, solve_cached
+
+PUZZLE = (
+    (0, 0, 0, 0, 3, 0, 0, 0, 8),
+    (0, 4, 2, 0, 0, 0, 6, 0, 0),
+    (6, 0, 9, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 5, 7, 0, 0, 4),
+    (3, 0, 0, 0, 0, 0, 0, 0, 7),
+    (2, 0, 0, 9, 4, 0, 0, 6, 0),
+    (0, 0, 5, 0, 0, 3, 2, 0, 1),
+    (0, 0, 1, 0, 0, 0, 0, 7, 0),
+    (0, 0, 0, 0, 2, 0, 0, 0, 0),
+)
+
+
+def test_solve_cached_isolates_callers():
+    """Mutating a cached result must not leak into the next call."""
+    _solve_cached.cache_clear()
+
+    first = solve_cached(PUZZLE)
+    expected = copy.deepcopy(first)
+
+    # Change everything a caller can reach
+    first["solved_grid"][0][0] = 0
+    first["techniques_applied"].append("Guess")
+    for step in first["solving_steps"]:
+        step["grid"][0][0] = 0
+        step["candidates"][0][0].append(0)
+        for change in step["candidate_changes"]:
+            change["location"] = "Z0"
+        step.get("solved_positions", []).append("Z0=0")
+        step["technique"] = "Guess"
+    first["solving_steps"].pop()
+
+    second = solve_cached(PUZZLE)
+
+    assert _solve_cached.cache_info().hits == 1
+    assert second == expected
+    assert second == enhanced_solver.solve(PUZZLE)
@@ -3,107 +3,57 @@ Test the step-by-step solver that applies one technique at a time.
 """
 
 from services.step_by_step_solver import step_by_step_solver
-
-
-def print_grid(grid, title="Grid"):
-    """Print a Sudoku grid with title."""
-    print(f"\n{title}:")
-    print("+-------+-------+-------+")
-    for i, row in enumerate(grid):
-        print("|", end=" ")
-        for j, cell in enumerate(row):
-            print(cell if cell != 0 else ".", end=" ")
-            if j % 3 == 2 and j < 8:
-                print("|", end=" ")
-        print("|")
-        if i % 3 == 2 and i < 8:
-            print("+-------+-------+-------+")
-    print("+-------+-------+-------+")
-
-
-def print_step_details(step, step_index):
-    """Print detailed information about a solving step."""
-    step_type = step.get("step_type", "unknown")
-
-    # Different formatting based on step type
-    if step_type == "constraint_elimination":
-        print(f"\n{'─'*60}")
-        print(f"⚙️  CONSTRAINT PROPAGATION")
-        print(f"{'─'*60}")
-        print(f"📋 {step['description']}")
-        print(f"💡 {step['explanation']}")
-
-        if step.get("candidate_changes"):
-            print(f"🔍 Constraint eliminations: {len(step['candidate_changes'])}")
-            # Group eliminations by affected cells
-            affected_cells = set()
-            for change in step["candidate_changes"]:
-                affected_cells.add(change["location"])
-
-            print(f"   Affected cells: {', '.join(sorted(affected_cells)[:8])}")
-            if len(affected_cells) > 8:
-                print(f"   ... and {len(affected_cells)-8} more cells")
-
-    else:  # technique step
-        print(f"\n{'='*60}")
-        print(f"🧠 {step.get('technique', 'UNKNOWN').upper()}")
-        if step.get("step_number"):
-            print(f"Step #{step['step_number']}")
-        print(f"{'='*60}")
-        print(f"📋 {step['description']}")
-        if step.get("explanation"):
-            print(f"💡 {step['explanation']}")
-
-        if step.get("cells_solved", 0) > 0:
-            print(f"✅ Cells filled: {', '.join(step.get('solved_positions', []))}")
-
-        if step.get("focus_cells"):
-            from helpers.get_location import get_cell_location
-
-            focus_locations = [get_cell_location(r, c) for r, c in step["focus_cells"]]
-            print(f"🎯 Focus cells: {', '.join(focus_locations)}")
-
-        if step.get("value"):
-            print(f"🔢 Value placed: {step['value']}")
-
-        if step.get("candidate_changes"):
-            print(f"🔍 Candidate eliminations: {len(step['candidate_changes'])}")
-            for change in step["candidate_changes"][:3]:  # Show first 3
-                eliminated = change.get("eliminated", [])
-                print(f"   {change['location']}: removed {eliminated}")
-            if len(step["candidate_changes"]) > 3:
-                print(
-                    f"   ... and {len(step['candidate_changes'])-3} more eliminations"
-                )
-
-    # Show progress
-    remaining = sum(1 for row in step["grid"] for cell in row if cell == 0)
-    print(f"📊 Progress: {remaining} cells remaining")
+from tests._display import VERBOSE, print_grid, print_step_details
+
+# Puzzles shared by the tests; tuples, since neither the board nor the solver
+# mutates its input
+PUZZLE_STEPS = (
+    (0, 0, 0, 0, 3, 0, 0, 0, 8),
+    (0, 4, 2, 0, 0, 0, 6, 0, 0),
+    (6, 0, 9, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 5, 7, 0, 0, 4),
+    (3, 0, 0, 0, 0, 0, 0, 0, 7),
+    (2, 0, 0, 9, 4, 0, 0, 6, 0),
+    (0, 0, 5, 0, 0, 3, 2, 0, 1),
+    (0, 0, 1, 0, 0, 0, 0, 7, 0),
+    (0, 0, 0, 0, 2, 0, 0, 0, 0),
+)
+
+PUZZLE_MIX = (
+    (0, 0, 0, 6, 0, 0, 4, 0, 0),
+    (7, 0, 0, 0, 0, 3, 6, 0, 0),
+    (0, 0, 0, 0, 9, 1, 0, 8, 0),
+    (0, 0, 0, 0, 0, 0, 0, 0, 0),
+    (0, 5, 0, 1, 8, 0, 0, 0, 3),
+    (0, 0, 0, 3, 0, 6, 0, 4, 5),
+    (0, 4, 0, 2, 0, 0, 0, 6, 0),
+    (9, 0, 3, 0, 0, 0, 0, 0, 0),
+    (0, 2, 0, 0, 0, 0, 1, 0, 0),
+)
 
 
 def test_step_by_step_solver():
     """Test the step-by-step solver that applies one technique at a time."""
-    print("STEP-BY-STEP SUDOKU SOLVER - ONE TECHNIQUE AT A TIME")
-    print("=" * 70)
+    if VERBOSE:
+        print("STEP-BY-STEP SUDOKU SOLVER - ONE TECHNIQUE AT A TIME")
+        print("=" * 70)
 
     # Use a puzzle that will show multiple step types
-    puzzle = [
-        [0, 0, 0, 0, 3, 0, 0, 0, 8],
-        [0, 4, 2, 0, 0, 0, 6, 0, 0],
-        [6, 0, 9, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 5, 7, 0, 0, 4],
-        [3, 0, 0, 0, 0, 0, 0, 0, 7],
-        [2, 0, 0, 9, 4, 0, 0, 6, 0],
-        [0, 0, 5, 0, 0, 3, 2, 0, 1],
-        [0, 0, 1, 0, 0, 0, 0, 7, 0],
-        [0, 0, 0, 0, 2, 0, 0, 0, 0],
-    ]
+    puzzle = PUZZLE_STEPS
 
     print_grid(puzzle, "Initial Puzzle")
 
     # Solve with step-by-step solver (applies one technique at a time)
     result = step_by_step_solver.solve(puzzle)
 
+    assert result["is_solved"]
+    assert result["techniques_applied"] == ["Naked Single", "Hidden Single"]
+    assert result["total_steps"] == len(result["solving_steps"])
+    assert all(0 not in row for row in result["solved_grid"])
+
+    if not VERBOSE:
+        return
+
     print(f"\n Solving Summary:")
     print(f"   Puzzle solved: {result['is_solved']}")
     print(f"   Total steps: {result['total_steps']}")
@@ -126,25 +76,10 @@ def test_step_by_step_solver():
     if result["is_solved"]:
         print_grid(result["solved_grid"], "Final Solution")
 
-    return result
-
 
 def test_step_types():
     """Test to verify step type separation."""
-    print("\n\n🔍 STEP TYPE ANALYSIS")
-    print("=" * 50)
-
-    puzzle = [
-        [0, 0, 0, 6, 0, 0, 4, 0, 0],
-        [7, 0, 0, 0, 0, 3, 6, 0, 0],
-        [0, 0, 0, 0, 9, 1, 0, 8, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 5, 0, 1, 8, 0, 0, 0, 3],
-        [0, 0, 0, 3, 0, 6, 0, 4, 5],
-        [0, 4, 0, 2, 0, 0, 0, 6, 0],
-        [9, 0, 3, 0, 0, 0, 0, 0, 0],
-        [0, 2, 0, 0, 0, 0, 1, 0, 0],
-    ]
+    puzzle = PUZZLE_MIX
 
     result = step_by_step_solver.solve(puzzle)
 
@@ -156,6 +91,19 @@ def test_step_types():
             step_types[step_type] = 0
         step_types[step_type] += 1
 
+    # Techniques and constraint propagation are reported as separate steps
+    assert set(step_types) == {"technique", "constraint_elimination"}
+    for step in result["solving_steps"]:
+        if step["step_type"] == "constraint_elimination":
+            assert step["technique"] == "Constraint Propagation"
+            assert step["cells_solved"] == 0
+
+    if not VERBOSE:
+        return
+
+    print("\n\n🔍 STEP TYPE ANALYSIS")
+    print("=" * 50)
+
     print(f"Step Type Breakdown:")
     for step_type, count in step_types.items():
         print(f"   {step_type}: {count} steps")
@@ -2,175 +2,128 @@
 Test individual technique applications to verify single-step behavior.
 """
 
+import pytest
+
 from board.board import SudokuBoard
 from logic.naked_single import apply_one_naked_single
 from logic.hidden_single import apply_one_hidden_single
 from logic.naked_pairs import apply_one_naked_pair
 from logic.hidden_pairs import apply_one_hidden_pair
 from logic.naked_triples import apply_one_naked_triple
-
-
-def print_grid(grid, title="Grid"):
-    """Print a Sudoku grid with title."""
-    print(f"\n{title}:")
-    print("+-------+-------+-------+")
-    for i, row in enumerate(grid):
-        print("|", end=" ")
-        for j, cell in enumerate(row):
-            print(cell if cell != 0 else ".", end=" ")
-            if j % 3 == 2 and j < 8:
-                print("|", end=" ")
-        print("|")
-        if i % 3 == 2 and i < 8:
-            print("+-------+-------+-------+")
-    print("+-------+-------+-------+")
-
-
-def test_single_naked_single():
-    """Test applying one naked single technique."""
-    print("TESTING SINGLE NAKED SINGLE APPLICATION")
-    print("=" * 50)
-
-    # Create a puzzle with a naked single
-    puzzle = [
-        [1, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 2, 3, 4, 5, 6, 7, 8, 9],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
-    board = SudokuBoard(puzzle)
-    board.update_candidates()
-
-    print_grid([[cell.get_value() for cell in row] for row in board.grid], "Before")
-
-    # Check candidates for cell [0][1] - should only have candidate 9
-    candidates = board.grid[0][1].get_candidates()
-    print(f"Candidates for R1C2: {sorted(candidates)}")
-
-    # Apply one naked single
-    changed, step = apply_one_naked_single(board)
-
-    print(f"\nTechnique applied: {changed}")
-    if step:
-        print(f"Technique: {step.technique}")
-        print(f"Description: {step.description}")
-        print(f"Focus cells: {step.focus_cells}")
-        print(f"Value placed: {step.value}")
-
-    print_grid([[cell.get_value() for cell in row] for row in board.grid], "After")
-
-
-def test_single_hidden_single():
-    """Test applying one hidden single technique."""
-    print("\n\nTESTING SINGLE HIDDEN SINGLE APPLICATION")
-    print("=" * 50)
-
-    # Create a puzzle with a hidden single
-    puzzle = [
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [1, 2, 3, 4, 5, 6, 7, 8, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
+from tests._display import VERBOSE, print_grid
+
+# Puzzle for the technique sequence test; a tuple, since SudokuBoard only
+# reads it
+PUZZLE_STEPS = (
+    (0, 0, 0, 0, 3, 0, 0, 0, 8),
+    (0, 4, 2, 0, 0, 0, 6, 0, 0),
+    (6, 0, 9, 0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 5, 7, 0, 0, 4),
+    (3, 0, 0, 0, 0, 0, 0, 0, 7),
+    (2, 0, 0, 9, 4, 0, 0, 6, 0),
+    (0, 0, 5, 0, 0, 3, 2, 0, 1),
+    (0, 0, 1, 0, 0, 0, 0, 7, 0),
+    (0, 0, 0, 0, 2, 0, 0, 0, 0),
+)
+
+
+def log(*args):
+    """Print only when verbose output is enabled."""
+    if VERBOSE:
+        print(*args)
+
+
+EMPTY_PUZZLE = ((0,) * 9,) * 9
+
+# R2C1 is the only cell down to one candidate: its row leaves only 1
+NAKED_SINGLE_PUZZLE = ((0,) * 9, (0, 2, 3, 4, 5, 6, 7, 8, 9)) + ((0,) * 9,) * 7
+
+HIDDEN_SINGLE_PUZZLE = ((0,) * 9, (1, 2, 3, 4, 5, 6, 7, 8, 0)) + ((0,) * 9,) * 7
+
+
+# expected_value maps the cell the technique fills to the value placed there;
+# expected_candidates maps cells to the candidates they are left with
+@pytest.mark.parametrize(
+    "puzzle, candidates, technique_fn, technique, expected_value, expected_candidates",
+    [
+        pytest.param(
+            NAKED_SINGLE_PUZZLE,
+            {},
+            apply_one_naked_single,
+            "Naked Single",
+            {(1, 0): 1},
+            {},
+            id="naked-single",
+        ),
+        # 9 can only go in R2C9
+        pytest.param(
+            HIDDEN_SINGLE_PUZZLE,
+            {},
+            apply_one_hidden_single,
+            "Hidden Single",
+            {(1, 8): 9},
+            {},
+            id="hidden-single",
+        ),
+        # The pair {1, 2} in R1C1/R1C2 leaves only 3 in R1C3
+        pytest.param(
+            EMPTY_PUZZLE,
+            {(0, 0): {1, 2}, (0, 1): {1, 2}, (0, 2): {1, 2, 3}},
+            apply_one_naked_pair,
+            "Naked Pair",
+            {},
+            {(0, 0): {1, 2}, (0, 1): {1, 2}, (0, 2): {3}},
+            id="naked-pair",
+        ),
+    ],
+)
+def test_single_technique(
+    puzzle, candidates, technique_fn, technique, expected_value, expected_candidates
+):
+    """Test applying one technique once: what it reports and leaves behind."""
     board = SudokuBoard(puzzle)
     board.update_candidates()
+    for (r, c), cell_candidates in candidates.items():
+        board.grid[r][c].set_candidates(cell_candidates)
 
     print_grid([[cell.get_value() for cell in row] for row in board.grid], "Before")
 
-    # Apply one hidden single
-    changed, step = apply_one_hidden_single(board)
+    changed, step = technique_fn(board)
 
-    print(f"\nTechnique applied: {changed}")
+    log(f"\nTechnique applied: {changed}")
     if step:
-        print(f"Technique: {step.technique}")
-        print(f"Description: {step.description}")
-        print(f"Focus cells: {step.focus_cells}")
-        print(f"Value placed: {step.value}")
+        log(f"Technique: {step.technique}")
+        log(f"Description: {step.description}")
+        log(f"Focus cells: {step.focus_cells}")
+        log(f"Value placed: {step.value}")
+        log(f"Eliminations: {step.eliminations}")
 
     print_grid([[cell.get_value() for cell in row] for row in board.grid], "After")
 
+    assert changed
+    assert step.technique == technique
 
-def test_single_naked_pair():
-    """Test applying one naked pair technique."""
-    print("\n\nTESTING SINGLE NAKED PAIR APPLICATION")
-    print("=" * 50)
-
-    # Create a puzzle with naked pairs
-    puzzle = [
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
-    board = SudokuBoard(puzzle)
-
-    # Manually set up a naked pair scenario
-    # Set cells [0][0] and [0][1] to have candidates {1, 2}
-    # Set cell [0][2] to have candidates {1, 2, 3}
-    board.grid[0][0].set_candidates({1, 2})
-    board.grid[0][1].set_candidates({1, 2})
-    board.grid[0][2].set_candidates({1, 2, 3})
+    for (r, c), value in expected_value.items():
+        assert board.grid[r][c].get_value() == value
+        assert step.value == value
+        assert step.focus_cells == [(r, c)]
 
-    print("Before naked pair application:")
-    print(f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}")
-    print(f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}")
-    print(f"R1C3 candidates: {sorted(board.grid[0][2].get_candidates())}")
-
-    # Apply one naked pair
-    changed, step = apply_one_naked_pair(board)
-
-    print(f"\nTechnique applied: {changed}")
-    if step:
-        print(f"Technique: {step.technique}")
-        print(f"Description: {step.description}")
-        print(f"Focus cells: {step.focus_cells}")
-        print(f"Eliminations: {step.eliminations}")
-
-    print("\nAfter naked pair application:")
-    print(f"R1C1 candidates: {sorted(board.grid[0][0].get_candidates())}")
-    print(f"R1C2 candidates: {sorted(board.grid[0][1].get_candidates())}")
-    print(f"R1C3 candidates: {sorted(board.grid[0][2].get_candidates())}")
+    for (r, c), remaining in expected_candidates.items():
+        assert board.grid[r][c].get_candidates() == remaining
 
 
 def test_technique_sequence():
     """Test applying techniques in sequence to see single-step behavior."""
-    print("\n\nTESTING TECHNIQUE SEQUENCE")
-    print("=" * 50)
-
-    puzzle = [
-        [0, 0, 0, 0, 3, 0, 0, 0, 8],
-        [0, 4, 2, 0, 0, 0, 6, 0, 0],
-        [6, 0, 9, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 5, 7, 0, 0, 4],
-        [3, 0, 0, 0, 0, 0, 0, 0, 7],
-        [2, 0, 0, 9, 4, 0, 0, 6, 0],
-        [0, 0, 5, 0, 0, 3, 2, 0, 1],
-        [0, 0, 1, 0, 0, 0, 0, 7, 0],
-        [0, 0, 0, 0, 2, 0, 0, 0, 0],
-    ]
+    log("\n\nTESTING TECHNIQUE SEQUENCE")
+    log("=" * 50)
+
+    puzzle = PUZZLE_STEPS
 
     board = SudokuBoard(puzzle)
     board.update_candidates()
 
     print_grid([[cell.get_value() for cell in row] for row in board.grid], "Initial")
+    initial_empty = sum(row.count(0) for row in puzzle)
 
     techniques = [
         ("Naked Single", apply_one_naked_single),
@@ -182,26 +135,24 @@ def test_technique_sequence():
 
     step_count = 0
     for i in range(5):  # Try up to 5 iterations
-        print(f"\n--- Iteration {i+1} ---")
+        log(f"\n--- Iteration {i+1} ---")
 
         for technique_name, technique_func in techniques:
             changed, step = technique_func(board)
 
             if changed and step:
                 step_count += 1
-                print(f" Step {step_count}: {technique_name}")
-                print(f"   {step.description}")
+                log(f" Step {step_count}: {technique_name}")
+                log(f"   {step.description}")
 
                 if step.value:
-                    print(f"   Filled cell with value {step.value}")
+                    log(f"   Filled cell with value {step.value}")
 
                 if step.eliminations:
                     elim_count = sum(
-                        len(positions)
-                        for elim in step.eliminations
-                        for positions in elim.values()
+                        len(positions) for positions in step.eliminations.values()
                     )
-                    print(f"   Eliminated {elim_count} candidates")
+                    log(f"   Eliminated {elim_count} candidates")
 
                 # Apply constraint propagation
                 board.update_candidates()
@@ -210,19 +161,20 @@ def test_technique_sequence():
                 remaining = sum(
                     1 for row in board.grid for cell in row if not cell.is_solved()
                 )
-                print(f"   {remaining} cells remaining")
+                log(f"   {remaining} cells remaining")
 
                 # Only apply one technique per iteration
                 break
         else:
-            print("No technique could be applied")
+            log("No technique could be applied")
             break
 
     print_grid([[cell.get_value() for cell in row] for row in board.grid], "Final")
 
+    # Each iteration places at most one value
+    assert step_count == 5
+    assert initial_empty - remaining == step_count
+
 
 if __name__ == "__main__":
-    test_single_naked_single()
-    test_single_hidden_single()
-    test_single_naked_pair()
-    test_technique_sequence()
+    pytest.main([__file__])
@@ -5,6 +5,10 @@ const BACKEND_URL =
   process.env.NEXT_PUBLIC_BACKEND_URL_IP ||
   process.env.NEXT_PUBLIC_BACKEND_URL_LOCALHOST;
 
+// One shared client for every call, so requests reuse its configuration and
+// the browser's kept-alive connection to the backend
+const apiClient = axios.create({ baseURL: BACKEND_URL });
+
 /**
  * Service for API interactions
  */
@@ -25,7 +29,7 @@ const apiService = {
    */
   solvePuzzle: async (puzzle) => {
     try {
-      const response = await axios.post(`${BACKEND_URL}/solve`, { puzzle });
+      const response = await apiClient.post("/solve", { puzzle });
       return response.data;
     } catch (error) {
       const errorData = error.response?.data?.detail;
@@ -69,9 +73,7 @@ const apiService = {
    */
   applySingleStep: async (puzzle) => {
     try {
-      const response = await axios.post(`${BACKEND_URL}/solve-step`, {
-        puzzle,
-      });
+      const response = await apiClient.post("/solve-step", { puzzle });
       return response.data;
     } catch (error) {
       const errorData = error.response?.data?.detail;